@@ -6,7 +6,9 @@ Licensed under the MIT License.
 from http import HTTPStatus
 import json
 import logging
+import re
 import asyncio
+import functools
 from datetime import datetime
 
 from aiohttp import web
@@ -15,9 +17,16 @@ from botbuilder.core.integration import aiohttp_error_middleware
 from botbuilder.schema import Activity, ActivityTypes
 
 from bot import bot_app
-from webhook_handler import JiraWebhookHandler
-from teams_notifier import initialize_teams_notifier, send_teams_notification
+from webhook_handler import get_handler
+from teams_notifier import (
+    CONVERSATION_STORE,
+    initialize_teams_notifier,
+    queue_teams_notification as _queue_teams_notification,
+    send_teams_notification as _send_teams_notification,
+    stop_notification_flusher,
+)
 from customer_actions import CustomerActionsHandler
+from mcp_slm_client import close_mcp_session
 
 
 # Setup logging
@@ -25,14 +34,31 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize webhook handler
-webhook_handler = JiraWebhookHandler()
+webhook_handler = get_handler()
 
 # Initialize Teams notifier
 teams_notifier = initialize_teams_notifier(bot_app.adapter)
 
+# Bind the adapter and conversation store once for proactive notifications
+send_teams_notification = functools.partial(
+    _send_teams_notification,
+    adapter=bot_app.adapter,
+    conversation_references=CONVERSATION_STORE,
+)
+queue_teams_notification = functools.partial(_queue_teams_notification, send=send_teams_notification)
+
 # Initialize customer actions handler
 customer_actions_handler = CustomerActionsHandler()
 
+# Ticket keywords per action type, checked in priority order
+_ACTION_KEYWORDS = (
+    ("extend_trial", re.compile(r"extend trial|trial extension|extend the trial")),
+    ("upgrade_subscription", re.compile(r"upgrade|enterprise|upgrade subscription")),
+    ("enable_feature", re.compile(r"enable feature|enable beta|activate feature")),
+    ("approve_signup", re.compile(r"approve signup|activate account|signup approval")),
+    ("extend_subscription", re.compile(r"extend subscription|subscription extension")),
+)
+
 def extract_action_from_ticket(ticket_data):
     """
     Extract the action type and details from JIRA ticket data
@@ -71,11 +97,10 @@ def extract_action_from_ticket(ticket_data):
         # Determine action type based on keywords
         action_details = {"customer_id": "CUST001"}  # Default customer ID
         
-        if any(keyword in full_text for keyword in ["extend trial", "trial extension", "extend the trial"]):
-            return "extend_trial", action_details
-        elif any(keyword in full_text for keyword in ["upgrade", "enterprise", "upgrade subscription"]):
-            return "upgrade_subscription", action_details
-        elif any(keyword in full_text for keyword in ["enable feature", "enable beta", "activate feature"]):
+        action_type = next(
+            (action for action, pattern in _ACTION_KEYWORDS if pattern.search(full_text)), None
+        )
+        if action_type == "enable_feature":
             # Try to extract feature name
             feature = None
             for allowed_feature in customer_actions_handler.allowed_features:
@@ -85,10 +110,8 @@ def extract_action_from_ticket(ticket_data):
             if feature:
                 action_details["feature"] = feature
                 return "enable_feature", action_details
-        elif any(keyword in full_text for keyword in ["approve signup", "activate account", "signup approval"]):
-            return "approve_signup", action_details
-        elif any(keyword in full_text for keyword in ["extend subscription", "subscription extension"]):
-            return "extend_subscription", action_details
+        elif action_type:
+            return action_type, action_details
         
         # Default fallback
         print(f"⚠️ Could not determine action type from ticket text")
@@ -115,7 +138,7 @@ async def execute_customer_action_and_notify(ticket_key, ticket_data):
 👥 Please check ticket details manually.
 
 This notification was triggered by JIRA approval."""
-            await send_teams_notification(notification, ticket_key)
+            queue_teams_notification(notification, ticket_key)
             return
         
         print(f"🚀 Executing action: {action_type} with details: {action_details}")
@@ -148,9 +171,9 @@ The requested customer action has been executed."""
 Please review the action manually."""
         
         # Send notification to Teams
-        await send_teams_notification(notification, ticket_key)
+        queue_teams_notification(notification, ticket_key)
         
-        print(f"📨 Sent action result notification for ticket {ticket_key}")
+        print(f"📨 Queued action result notification for ticket {ticket_key}")
         
     except Exception as e:
         print(f"❌ Error executing customer action for ticket {ticket_key}: {e}")
@@ -163,7 +186,7 @@ Please review the action manually."""
 
 Please review and execute the action manually."""
         
-        await send_teams_notification(error_notification, ticket_key)
+        queue_teams_notification(error_notification, ticket_key)
 
 routes = web.RouteTableDef()
 
@@ -321,12 +344,12 @@ async def jira_webhook(req: web.Request) -> web.Response:
             📋 Reason: {notification_reason}
             This notification was triggered by a status change in JIRA."""
             
-            # Send proactive notification to Teams
-            await send_teams_notification(notification, ticket_key)
+            # Queue proactive notification to Teams; the flusher logs delivery
+            queue_teams_notification(notification, ticket_key)
             
             # Log the notification
-            print(f"📨 Sent JIRA approval notification for ticket {ticket_key} - Reason: {notification_reason}")
-            logger.info(f"Sent proactive notification for ticket {ticket_key} - {notification_reason}")
+            print(f"📨 Queued JIRA approval notification for ticket {ticket_key} - Reason: {notification_reason}")
+            logger.info(f"Queued proactive notification for ticket {ticket_key} - {notification_reason}")
         else:
             print(f"ℹ️  No approval notification sent for ticket {ticket_key}")
         
@@ -394,10 +417,23 @@ async def test_send_notification(req: web.Request) -> web.Response:
             "error": str(e)
         }, status=500)
 
+async def on_cleanup(_app: web.Application):
+    """Flush queued Teams notifications and release shared HTTP connection pools on shutdown"""
+    await stop_notification_flusher()
+    await close_mcp_session()
+
 app = web.Application(middlewares=[aiohttp_error_middleware])
 app.add_routes(routes)
+app.on_cleanup.append(on_cleanup)
 
 from config import Config
 
 if __name__ == "__main__":
+    # Use uvloop's event loop when it is installed (Linux/macOS only)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     web.run_app(app, host="localhost", port=Config.PORT)
\ No newline at end of file
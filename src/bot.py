@@ -14,7 +14,7 @@ from teams.ai.planners import AssistantsPlanner, OpenAIAssistantsOptions, AzureO
 from teams.state import TurnState
 from teams.feedback_loop_data import FeedbackLoopData
 
-from config import Config
+from config import get_config
 from jira_integration import JiraIntegration, create_support_ticket, update_support_ticket
 from utils.date_parser import parse_natural_date, validate_future_date
 
@@ -96,7 +96,7 @@ def get_mock_customer_info(email: str) -> dict:
         "status": "not_found"
     })
 
-config = Config()
+config = get_config()
 
 planner = AssistantsPlanner[TurnState](
     AzureOpenAIAssistantsOptions(
@@ -601,7 +601,7 @@ async def process_confirmed_action(context: TurnContext, state: TurnState):
             
             if success:
                 # Storing the conversation reference for proactive notifications
-                store_conversation_reference(
+                await store_conversation_reference(
                     ticket_key,
                     TurnContext.get_conversation_reference(context.activity),
                     context.activity.from_property.id
@@ -4,6 +4,7 @@ Licensed under the MIT License.
 """
 
 import os
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
@@ -26,6 +27,7 @@ class Config:
     APP_PASSWORD = os.environ.get("BOT_PASSWORD", "")
     APP_TYPE = os.environ.get("BOT_TYPE", "")
     APP_TENANTID = os.environ.get("BOT_TENANT_ID", "")
+    DEBUG = os.environ.get("DEBUG", "").lower() in ("1", "true", "yes")
     AZURE_OPENAI_API_KEY = os.environ.get("SECRET_AZURE_OPENAI_API_KEY", os.environ.get("AZURE_OPENAI_API_KEY", "")) # Azure OpenAI API key
     AZURE_OPENAI_ENDPOINT = os.environ["AZURE_OPENAI_ENDPOINT"] # Azure OpenAI endpoint
     AZURE_OPENAI_MODEL_DEPLOYMENT_NAME = os.environ["AZURE_OPENAI_MODEL_DEPLOYMENT_NAME"] # Azure OpenAI deployment model name
@@ -39,3 +41,8 @@ class Config:
         print(f"  AZURE_OPENAI_MODEL: {self.AZURE_OPENAI_MODEL_DEPLOYMENT_NAME}")
         print(f"  AZURE_OPENAI_ASSISTANT_ID: {self.AZURE_OPENAI_ASSISTANT_ID}")
         print(f"  API_KEY (first 10 chars): {self.AZURE_OPENAI_API_KEY[:10]}..." if self.AZURE_OPENAI_API_KEY else "  API_KEY: NOT SET")
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Shared Config instance, constructed once per process"""
+    return Config()
@@ -7,9 +7,9 @@ Integrates with Atlassian JIRA API v3 to create and manage support tickets
 import os
 import sys
 import requests
-import json
 import logging
 from typing import Dict, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from dotenv import load_dotenv
 from urllib.parse import quote_plus
@@ -53,6 +53,22 @@ class JiraIntegration:
             "Accept": "application/json",
             "Content-Type": "application/json"
         }
+        
+        # One keep-alive session per client so a ticket's follow-up calls reuse the connection
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    
+    def close(self):
+        """Close the client's HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def create_customer_support_ticket(self, action: str, email: str, details: Dict[str, Any]) -> Tuple[bool, str, str]:
         """
@@ -106,11 +122,7 @@ class JiraIntegration:
             
             # Create the ticket
             url = f"{self.base_url}/rest/api/3/issue"
-            response = requests.post(
-                url, 
-                headers=self.headers, 
-                auth=self.auth, 
-                data=json.dumps(ticket_payload)            )
+            response = self.session.post(url, json=ticket_payload)
             
             if response.status_code in (200, 201):
                 result = response.json()
@@ -147,13 +159,13 @@ class JiraIntegration:
             return True
         
         try:
-            # Add comment if provided
+            # Add comment if provided, ahead of the transition in the ticket history
             if comment:
                 self._add_comment(ticket_key, comment)
             
             # Get available transitions
             transitions_url = f"{self.base_url}/rest/api/3/issue/{ticket_key}/transitions"
-            response = requests.get(transitions_url, headers=self.headers, auth=self.auth)
+            response = self.session.get(transitions_url)
             
             if response.status_code == 200:
                 transitions = response.json().get('transitions', [])
@@ -171,12 +183,7 @@ class JiraIntegration:
                         "transition": {"id": target_transition}
                     }
                     
-                    response = requests.post(
-                        transitions_url,
-                        headers=self.headers,
-                        auth=self.auth,
-                        data=json.dumps(transition_payload)
-                    )
+                    response = self.session.post(transitions_url, json=transition_payload)
                     
                     if response.status_code == 204:
                         logger.info(f"Updated ticket {ticket_key} to status {status}")
@@ -216,12 +223,7 @@ class JiraIntegration:
             }
             
             url = f"{self.base_url}/rest/api/3/issue/{ticket_key}/comment"
-            response = requests.post(
-                url,
-                headers=self.headers,
-                auth=self.auth,
-                data=json.dumps(comment_payload)
-            )
+            response = self.session.post(url, json=comment_payload)
             
             return response.status_code in (200, 201)
             
@@ -236,7 +238,7 @@ class JiraIntegration:
         
         try:
             url = f"{self.base_url}/rest/api/3/issue/{ticket_key}/comment"
-            response = requests.get(url, headers=self.headers, auth=self.auth)
+            response = self.session.get(url)
             
             if response.status_code == 200:
                 comments_data = response.json()
@@ -347,7 +349,7 @@ class JiraIntegration:
         
         try:
             url = f"{self.base_url}/rest/api/3/issue/{ticket_key}?fields=status"
-            response = requests.get(url, headers=self.headers, auth=self.auth)
+            response = self.session.get(url)
             
             if response.status_code == 200:
                 ticket_data = response.json()
@@ -376,8 +378,8 @@ def create_support_ticket(action: str, email: str, **kwargs) -> Tuple[bool, str,
     Returns:
         Tuple of (success: bool, ticket_key: str, ticket_url: str)
     """
-    jira = JiraIntegration()
-    return jira.create_customer_support_ticket(action, email, kwargs)
+    with JiraIntegration() as jira:
+        return jira.create_customer_support_ticket(action, email, kwargs)
 
 def update_support_ticket(ticket_key: str, status: str, comment: str = "") -> bool:
     """
@@ -386,5 +388,5 @@ def update_support_ticket(ticket_key: str, status: str, comment: str = "") -> bo
     Returns:
         bool: Success status
     """
-    jira = JiraIntegration()
-    return jira.update_ticket_status(ticket_key, status, comment)
+    with JiraIntegration() as jira:
+        return jira.update_ticket_status(ticket_key, status, comment)
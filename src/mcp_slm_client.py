@@ -7,15 +7,66 @@ Integrates with MontyCloud MCP Server to access Day2 platform
 import os
 import json
 import asyncio
-import subprocess
 import logging
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional
+
+import aiohttp
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so MCP calls reuse pooled keep-alive connections
+# and cached DNS lookups instead of reconnecting on every request.
+# A session is bound to the event loop that created it, so it is
+# recreated whenever it is used from a different loop (e.g. a later asyncio.run())
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """Return the MCP session for the running event loop, creating it on first use"""
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        _shared_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+        _shared_session_loop = loop
+    return _shared_session
+
+async def close_mcp_session():
+    """Close the shared MCP session (call on application shutdown)"""
+    global _shared_session, _shared_session_loop
+    # A session left over from another loop cannot be closed from this one; just drop it
+    if (_shared_session is not None and not _shared_session.closed
+            and _shared_session_loop is asyncio.get_running_loop()):
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
+
 class MCPSLMClient:
     """MCP-based client for SLM operations using MontyCloud MCP Server"""
+
+    # Mock subscription and feature data used until the MCP tools exist
+    # TODO: Replace with actual MCP calls when tools become available
+    _MOCK_SUBSCRIPTION = MappingProxyType({
+        "plan": "trial",
+        "start_date": "2024-12-01",
+        "end_date": "2025-01-01"
+    })
+
+    _MOCK_FEATURES = MappingProxyType({
+        "tenant": "test-tenant",
+        "customer": "Test Customer",
+        "features": ("basic_monitoring", "cloud_deployment")
+    })
     
     def __init__(self):
         """Initialize MCP SLM client"""
@@ -35,12 +86,6 @@ class MCPSLMClient:
         
         self.endpoint_url = self.environment_urls.get(self.mcp_environment)
         
-        # if not self.api_key or not self.api_secret:
-        #     logger.warning("MCP API credentials not configured. Using fallback mode.")
-        #     self.fallback_mode = True
-        # else:
-        #     self.fallback_mode = False
-            
         logger.info(f"MCP Client initialized - Environment: {self.mcp_environment}, Endpoint: {self.endpoint_url}")
 
     async def _call_mcp_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -48,10 +93,6 @@ class MCPSLMClient:
         Call an MCP tool and return the result
         """
         try:
-            # if self.fallback_mode:
-            #     logger.warning(f"MCP credentials not available, using fallback for {tool_name}")
-            #     return await self._fallback_handler(tool_name, parameters)
-            
             # Prepare MCP request
             mcp_request = {
                 "jsonrpc": "2.0",
@@ -63,122 +104,70 @@ class MCPSLMClient:
                 }
             }
             
-            # Execute MCP call using curl
-            curl_command = [
-                'curl', '-X', 'POST', '--location', self.endpoint_url,
-                '--header', 'Accept: application/json, text/event-stream',
-                '--header', 'Content-Type: application/json',
-                '--header', f'x-api-key: {self.api_key}',
-                '--header', f'Authorization: {self.api_secret}',
-                '--data', json.dumps(mcp_request)
-            ]
+            headers = {
+                'Accept': 'application/json, text/event-stream',
+                'Content-Type': 'application/json',
+                'x-api-key': self.api_key,
+                'Authorization': self.api_secret
+            }
 
             print(f"Executing MCP tool: {tool_name} with parameters: {parameters}")
             
             logger.info(f"Calling MCP tool: {tool_name} with parameters: {parameters}")
-            result = subprocess.run(curl_command, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                print(f"Raw MCP response: {result.stdout}")
-                try:
-                    # Handle Server-Sent Events (SSE) format
-                    response_text = result.stdout.strip()
-                    if response_text.startswith('event: message\ndata: '):
-                        # Extract JSON from SSE format
-                        json_line = response_text.split('data: ', 1)[1].split('\n\n')[0]
-                        response_data = json.loads(json_line)
-                    else:
-                        # Regular JSON response
-                        response_data = json.loads(response_text)
+            session = _get_shared_session()
+            async with session.post(self.endpoint_url, headers=headers, data=json.dumps(mcp_request)) as response:
+                raw_response = await response.text()
+            
+            print(f"Raw MCP response: {raw_response}")
+            try:
+                # Handle Server-Sent Events (SSE) format
+                response_text = raw_response.strip()
+                if response_text.startswith('event: message\ndata: '):
+                    # Extract JSON from SSE format
+                    json_line = response_text.split('data: ', 1)[1].split('\n\n')[0]
+                    response_data = json.loads(json_line)
+                else:
+                    # Regular JSON response
+                    response_data = json.loads(response_text)
+                
+                if 'result' in response_data:
+                    result_data = response_data['result']
                     
-                    if 'result' in response_data:
-                        result_data = response_data['result']
-                        
-                        # Handle MCP tool response format - extract from content if needed
-                        if 'content' in result_data and isinstance(result_data['content'], list):
-                            if result_data['content'] and 'text' in result_data['content'][0]:
-                                # Parse the JSON text content
-                                tool_result = json.loads(result_data['content'][0]['text'])
-                                print(f"MCP tool {tool_name} response: {tool_result}")
-                                logger.info(f"MCP tool {tool_name} succeeded")
-                                return tool_result
-                        
-                        print(f"MCP tool {tool_name} response: {result_data}")
-                        logger.info(f"MCP tool {tool_name} succeeded")
-                        return result_data
-                    else:
-                        print(f"MCP tool {tool_name} failed: {response_data}")
-                        logger.error(f"MCP tool {tool_name} failed: {response_data}")
-                        return {"error": response_data.get('error', 'Unknown error')}
-                except json.JSONDecodeError as e:
-                    print(f"Failed to parse MCP response: {e}")
-                    print(f"Raw response was: {repr(result.stdout)}")
-                    logger.error(f"Failed to parse MCP response: {e}")
-                    return {"error": "Invalid JSON response from MCP server"}
-            else:
-                print(f"MCP call failed with stderr: {result.stderr}")
-                logger.error(f"MCP call failed: {result.stderr}")
-                return {"error": f"MCP call failed: {result.stderr}"}
+                    # Handle MCP tool response format - extract from content if needed
+                    if 'content' in result_data and isinstance(result_data['content'], list):
+                        if result_data['content'] and 'text' in result_data['content'][0]:
+                            # Parse the JSON text content
+                            tool_result = json.loads(result_data['content'][0]['text'])
+                            print(f"MCP tool {tool_name} response: {tool_result}")
+                            logger.info(f"MCP tool {tool_name} succeeded")
+                            return tool_result
+                    
+                    print(f"MCP tool {tool_name} response: {result_data}")
+                    logger.info(f"MCP tool {tool_name} succeeded")
+                    return result_data
+                else:
+                    print(f"MCP tool {tool_name} failed: {response_data}")
+                    logger.error(f"MCP tool {tool_name} failed: {response_data}")
+                    return {"error": response_data.get('error', 'Unknown error')}
+            except json.JSONDecodeError as e:
+                print(f"Failed to parse MCP response: {e}")
+                print(f"Raw response was: {repr(raw_response)}")
+                logger.error(f"Failed to parse MCP response: {e}")
+                return {"error": "Invalid JSON response from MCP server"}
                 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             print(f"MCP call timeout for tool: {tool_name}")
             logger.error(f"MCP call timeout for tool: {tool_name}")
             return {"error": "MCP call timeout"}
+        except aiohttp.ClientError as e:
+            print(f"MCP call failed: {e}")
+            logger.error(f"MCP call failed: {e}")
+            return {"error": f"MCP call failed: {e}"}
         except Exception as e:
             print(f"Error calling MCP tool {tool_name}: {e}")
             logger.error(f"Error calling MCP tool {tool_name}: {e}")
             return {"error": str(e)}
 
-    # async def _fallback_handler(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
-    #     """
-    #     Fallback handler when MCP credentials are not available
-    #     Uses the same mock data as the original slm_api.py
-    #     """
-    #     logger.info(f"Using fallback data for {tool_name}")
-        
-    #     # Import the mock data from original slm_api
-    #     from slm_api import SLMAPIClient
-        
-    #     fallback_client = SLMAPIClient()
-        
-    #     if tool_name == "validate_customer":
-    #         email = parameters.get('email', '')
-    #         if email in fallback_client.mock_customers:
-    #             customer_data = fallback_client.mock_customers[email]
-    #             return {
-    #                 "Name": customer_data["customer"],
-    #                 "signup_date": "2024-01-01"  # Mock signup date
-    #             }
-    #         else:
-    #             return {"error": "Customer not found"}
-                
-    #     elif tool_name == "fetch_subscription":
-    #         email = parameters.get('email', '')
-    #         if email in fallback_client.mock_customers:
-    #             customer_data = fallback_client.mock_customers[email]
-    #             return {
-    #                 "plan": customer_data["plan"],
-    #                 "start_date": "2024-12-01",  # Mock start date
-    #                 "end_date": customer_data["end_date"]
-    #             }
-    #         else:
-    #             return {"error": "Customer not found"}
-                
-    #     elif tool_name == "fetch_enabled_features":
-    #         email = parameters.get('email', '')
-    #         if email in fallback_client.mock_customers:
-    #             customer_data = fallback_client.mock_customers[email]
-    #             return {
-    #                 "tenant": customer_data["tenant"],
-    #                 "customer": customer_data["customer"],
-    #                 "features": customer_data["features"]
-    #             }
-    #         else:
-    #             return {"error": "Customer not found"}
-                
-    #     else:
-    #         return {"error": f"Unknown tool: {tool_name}"}
-
     async def validate_customer(self, customer_id: str) -> Optional[Dict[str, Any]]:
         """
         Validate customer existence using customer_id
@@ -379,39 +368,29 @@ class MCPSLMClient:
             print(f"✅ Email validation passed - customer found in MCP system")
             
             # Step 3: For testing, use mock subscription and feature data since MCP tools don't exist yet
-            # TODO: Replace with actual MCP calls when tools become available
-            mock_subscription = {
-                "plan": "trial",
-                "start_date": "2024-12-01",
-                "end_date": "2025-01-01"
-            }
-            
-            mock_features = {
-                "tenant": "test-tenant",
-                "customer": customer_info.get("name", "Test Customer"),
-                "features": ["basic_monitoring", "cloud_deployment"]
-            }
+            mock_subscription = self._MOCK_SUBSCRIPTION
+            mock_features = self._MOCK_FEATURES
             
             # Step 4: Build comprehensive validation result
             validation_result = {
                 "valid": True,
                 "customer_email": mcp_email,  # Email from MCP system (for bot internal use)
-                "customer_name": customer_info.get("name", mock_features.get("customer", "Unknown")),
-                "tenant": mock_features.get("tenant", "Unknown"),
-                "current_plan": mock_subscription.get("plan", "Unknown"),
-                "plan_end_date": mock_subscription.get("end_date", "Unknown"),
-                "features": mock_features.get("features", [])
+                "customer_name": customer_info.get("name", mock_features["customer"]),
+                "tenant": mock_features["tenant"],
+                "current_plan": mock_subscription["plan"],
+                "plan_end_date": mock_subscription["end_date"],
+                "features": list(mock_features["features"])
             }
             
             # Step 5: Action-specific validations
             if action_type == "extend_trial":
-                if mock_subscription.get("plan") != "trial":
+                if mock_subscription["plan"] != "trial":
                     validation_result["valid"] = False
-                    validation_result["error"] = f"Customer is on '{mock_subscription.get('plan')}' plan, not trial"
+                    validation_result["error"] = f"Customer is on '{mock_subscription['plan']}' plan, not trial"
                     validation_result["suggestion"] = "Trial extension is only available for trial customers"
                     
             elif action_type == "upgrade_subscription":
-                if mock_subscription.get("plan") == "enterprise":
+                if mock_subscription["plan"] == "enterprise":
                     validation_result["valid"] = False
                     validation_result["error"] = "Customer is already on enterprise plan"
                     validation_result["suggestion"] = "Customer is already on the highest plan available"
@@ -3,227 +3,345 @@ SLM (Service Level Management) API Integration
 Mock APIs for customer validation and tenant management
 """
 
+import asyncio
+import functools
 import logging
+import sys
+import time
 import aiohttp
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 from datetime import datetime, timedelta
 
+__all__ = ["SLMAPIClient", "create_slm_client"]
+
 logger = logging.getLogger(__name__)
 
+# Feature names - interned so every customer record shares one string object per feature
+FEAT_MULTITENANCY = sys.intern("Multitenancy")
+FEAT_AZURE = sys.intern("Azure")
+FEAT_COPILOT = sys.intern("Copilot")
+FEAT_FBP = sys.intern("FBP")
+FEAT_ORG_ONBOARDING = sys.intern("OrgOnboarding")
+FEAT_MAP = sys.intern("MAP")
+FEAT_TERRAFORM = sys.intern("Terraform")
+
+# Mock data for testing - all customers map to CUST001
+# Built once at import and shared read-only by every client instance;
+# keys are casefolded emails and lookups casefold their input to match
+_MOCK_CUSTOMERS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    "admin@acmecorp.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "standard",
+        "end_date": "2025-07-10",
+        "tenant": "acme-prod",
+        "customer": "AcmeCorp",
+        "features": (FEAT_COPILOT, FEAT_MULTITENANCY)
+    },
+    "devadmin@acmecorp.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "enterprise",
+        "end_date": "2026-01-01",
+        "tenant": "acme-dev",
+        "customer": "AcmeCorp",
+        "features": (FEAT_COPILOT, FEAT_TERRAFORM, FEAT_ORG_ONBOARDING, FEAT_MAP)
+    },
+    "admin@zenlabs.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "standard",
+        "end_date": "2025-06-28",
+        "tenant": "zenlabs-us",
+        "customer": "ZenLabs",
+        "features": ()
+    },
+    "euadmin@zenlabs.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "enterprise",
+        "end_date": "2025-12-01",
+        "tenant": "zenlabs-eu",
+        "customer": "ZenLabs",
+        "features": (FEAT_AZURE, FEAT_FBP, FEAT_MAP)
+    },
+    "ops@nextgentech.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "enterprise",
+        "end_date": "2025-10-15",
+        "tenant": "nextgen-prod",
+        "customer": "NextGenTech",
+        "features": (FEAT_MULTITENANCY, FEAT_ORG_ONBOARDING, FEAT_TERRAFORM)
+    },
+    "qa@nextgentech.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "standard",
+        "end_date": "2025-08-15",
+        "tenant": "nextgen-test",
+        "customer": "NextGenTech",
+        "features": (FEAT_COPILOT,)
+    },
+    "admin@skyai.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "standard",
+        "end_date": "2025-07-30",
+        "tenant": "skyai",
+        "customer": "SkyAI",
+        "features": (FEAT_FBP,)
+    },
+    "admin@orbitalsoft.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "enterprise",
+        "end_date": "2025-11-30",
+        "tenant": "orbital",
+        "customer": "OrbitalSoft",
+        "features": (FEAT_COPILOT, FEAT_AZURE, FEAT_MAP, FEAT_TERRAFORM)
+    },
+    "alpha@quanta.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "enterprise",
+        "end_date": "2025-12-31",
+        "tenant": "quanta-alpha",
+        "customer": "Quanta",
+        "features": (FEAT_MULTITENANCY, FEAT_ORG_ONBOARDING)
+    },
+    "beta@quanta.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "standard",
+        "end_date": "2025-08-01",
+        "tenant": "quanta-beta",
+        "customer": "Quanta",
+        "features": (FEAT_COPILOT,)
+    },
+    "root@helios.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "enterprise",
+        "end_date": "2026-02-15",
+        "tenant": "helios-root",
+        "customer": "Helios",
+        "features": (FEAT_AZURE, FEAT_FBP, FEAT_MAP, FEAT_TERRAFORM)
+    },
+    "staging@helios.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "standard",
+        "end_date": "2025-09-10",
+        "tenant": "helios-staging",
+        "customer": "Helios",
+        "features": ()
+    },
+    "admin@wavecore.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "enterprise",
+        "end_date": "2025-12-05",
+        "tenant": "wavecore",
+        "customer": "WaveCore",
+        "features": (FEAT_COPILOT, FEAT_FBP, FEAT_MULTITENANCY)
+    },
+    "prod@neuronx.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "standard",
+        "end_date": "2025-07-20",
+        "tenant": "neuronx-prod",
+        "customer": "NeuronX",
+        "features": (FEAT_ORG_ONBOARDING,)
+    },
+    "labs@neuronx.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "enterprise",
+        "end_date": "2025-11-01",
+        "tenant": "neuronx-labs",
+        "customer": "NeuronX",
+        "features": (FEAT_MAP, FEAT_AZURE)
+    },
+    # Add some trial customers for testing trial extensions
+    "trial@acmecorp.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "trial",
+        "end_date": "2025-07-01",
+        "tenant": "acme-trial",
+        "customer": "AcmeCorp",
+        "features": (FEAT_COPILOT,)
+    },
+    "trial@zenlabs.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "trial",
+        "end_date": "2025-06-25",
+        "tenant": "zenlabs-trial",
+        "customer": "ZenLabs",
+        "features": ()
+    },
+    "trial@skyai.com": {
+        "customer_id": "CUST001",
+        "signup_date": "2024-01-01",
+        "plan": "trial",
+        "end_date": "2025-07-05",
+        "tenant": "skyai-trial",
+        "customer": "SkyAI",
+        "features": (FEAT_FBP,)
+    }
+})
+
+# Secondary index by customer ID - all mock customers share CUST001,
+# so the first entry for an ID is the one returned
+_CUSTOMERS_BY_ID: Dict[str, Dict[str, Any]] = {}
+for _customer_data in _MOCK_CUSTOMERS.values():
+    _CUSTOMERS_BY_ID.setdefault(_customer_data["customer_id"], _customer_data)
+
+def _subscription_view(customer_data: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Read-only subscription projection of a mock customer record"""
+    return MappingProxyType({
+        "plan": customer_data["plan"],
+        "start_date": "2024-12-01",  # Mock start date
+        "end_date": customer_data["end_date"]
+    })
+
+def _features_view(customer_data: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Read-only enabled-features projection of a mock customer record"""
+    return MappingProxyType({
+        "tenant": customer_data["tenant"],
+        "customer": customer_data["customer"],
+        "features": customer_data["features"]
+    })
+
+def _features_result(view: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Copy a features view into the API's response shape, with features as a list"""
+    if view is None:
+        return None
+    return {**view, "features": list(view["features"])}
+
+# Per-email projections computed once and shared by every lookup
+_SUBSCRIPTION_VIEWS = {email.casefold(): _subscription_view(data) for email, data in _MOCK_CUSTOMERS.items()}
+_FEATURE_VIEWS = {email.casefold(): _features_view(data) for email, data in _MOCK_CUSTOMERS.items()}
+
+_ALLOWED_FEATURES = frozenset({
+    FEAT_MULTITENANCY, FEAT_AZURE, FEAT_COPILOT, FEAT_FBP,
+    FEAT_ORG_ONBOARDING, FEAT_MAP, FEAT_TERRAFORM
+})
+
+_TRIAL_ONLY_SUGGESTION = "Trial extension is only available for trial customers"
+
+# Rejections by (plan, action_type) -> (error, suggestion); any combination
+# not listed is valid (beta features and signup approval are always allowed)
+_ACTION_VERDICTS: Mapping[Tuple[str, str], Tuple[str, str]] = MappingProxyType({
+    ("standard", "extend_trial"): ("Customer is on 'standard' plan, not trial", _TRIAL_ONLY_SUGGESTION),
+    ("enterprise", "extend_trial"): ("Customer is on 'enterprise' plan, not trial", _TRIAL_ONLY_SUGGESTION),
+    ("enterprise", "upgrade_subscription"): (
+        "Customer is already on enterprise plan",
+        "Customer is already on the highest plan available"
+    )
+})
+
+# In-process cache for email-keyed lookups: {(method, base_url, email): (expires_at, future)}
+_RESULT_CACHE_TTL = 300  # seconds
+_RESULT_CACHE_CAPACITY = 1024
+_result_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, asyncio.Future]]" = OrderedDict()
+
+def _cached_by_email(method):
+    """
+    Memoize an email-keyed lookup coroutine for _RESULT_CACHE_TTL seconds.
+    Concurrent callers for the same email share a single in-flight lookup.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, email: str):
+        # Emails are case-insensitive, so "Admin@AcmeCorp.com" shares the entry for "admin@acmecorp.com";
+        # the lookup itself still receives the caller's email and normalizes it on its own
+        key = (method.__name__, self.base_url, email.casefold() if isinstance(email, str) else email)
+        now = time.monotonic()
+        entry = _result_cache.get(key)
+        
+        # Lookups still pending on another (e.g. closed) event loop cannot be awaited here
+        stale = entry is not None and not entry[1].done() and entry[1].get_loop() is not asyncio.get_running_loop()
+        
+        if entry is None or entry[0] <= now or stale:
+            future = asyncio.ensure_future(method(self, email))
+            future.add_done_callback(functools.partial(_evict_failed_lookup, key))
+            _result_cache[key] = (now + _RESULT_CACHE_TTL, future)
+            _result_cache.move_to_end(key)
+            while len(_result_cache) > _RESULT_CACHE_CAPACITY:
+                _result_cache.popitem(last=False)
+        else:
+            future = entry[1]
+        
+        # Shield so one cancelled caller does not cancel the shared lookup
+        return _copy_result(await asyncio.shield(future))
+    
+    return wrapper
+
+def _copy_result(result: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Give each caller its own copy of a cached result (and its lists) so mutations don't leak into the cache"""
+    if result is None:
+        return None
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
+
+def _evict_failed_lookup(key: Tuple[str, str, str], future: asyncio.Future):
+    """Drop a cached lookup that was cancelled or raised so it can be retried"""
+    if future.cancelled() or future.exception() is not None:
+        entry = _result_cache.get(key)
+        if entry is not None and entry[1] is future:
+            del _result_cache[key]
+
 class SLMAPIClient:
     """Client for SLM API operations"""
     
+    __slots__ = ("base_url", "session", "mock_customers", "customers_by_id", "allowed_features")
+    
     def __init__(self, base_url: str = "https://api.montycloud.com"):
         """Initialize SLM API client"""
         self.base_url = base_url
         self.session = None
         
-        # Mock data for testing - all customers map to CUST001
-        self.mock_customers = {
-            "admin@acmecorp.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "standard",
-                "end_date": "2025-07-10",
-                "tenant": "acme-prod",
-                "customer": "AcmeCorp",
-                "features": ["Copilot", "Multitenancy"]
-            },
-            "devadmin@acmecorp.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "enterprise",
-                "end_date": "2026-01-01",
-                "tenant": "acme-dev",
-                "customer": "AcmeCorp",
-                "features": ["Copilot", "Terraform", "OrgOnboarding", "MAP"]
-            },
-            "admin@zenlabs.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "standard",
-                "end_date": "2025-06-28",
-                "tenant": "zenlabs-us",
-                "customer": "ZenLabs",
-                "features": []
-            },
-            "euadmin@zenlabs.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "enterprise",
-                "end_date": "2025-12-01",
-                "tenant": "zenlabs-eu",
-                "customer": "ZenLabs",
-                "features": ["Azure", "FBP", "MAP"]
-            },
-            "ops@nextgentech.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "enterprise",
-                "end_date": "2025-10-15",
-                "tenant": "nextgen-prod",
-                "customer": "NextGenTech",
-                "features": ["Multitenancy", "OrgOnboarding", "Terraform"]
-            },
-            "qa@nextgentech.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "standard",
-                "end_date": "2025-08-15",
-                "tenant": "nextgen-test",
-                "customer": "NextGenTech",
-                "features": ["Copilot"]
-            },
-            "admin@skyai.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "standard",
-                "end_date": "2025-07-30",
-                "tenant": "skyai",
-                "customer": "SkyAI",
-                "features": ["FBP"]
-            },
-            "admin@orbitalsoft.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "enterprise",
-                "end_date": "2025-11-30",
-                "tenant": "orbital",
-                "customer": "OrbitalSoft",
-                "features": ["Copilot", "Azure", "MAP", "Terraform"]
-            },
-            "alpha@quanta.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "enterprise",
-                "end_date": "2025-12-31",
-                "tenant": "quanta-alpha",
-                "customer": "Quanta",
-                "features": ["Multitenancy", "OrgOnboarding"]
-            },
-            "beta@quanta.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "standard",
-                "end_date": "2025-08-01",
-                "tenant": "quanta-beta",
-                "customer": "Quanta",
-                "features": ["Copilot"]
-            },
-            "root@helios.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "enterprise",
-                "end_date": "2026-02-15",
-                "tenant": "helios-root",
-                "customer": "Helios",
-                "features": ["Azure", "FBP", "MAP", "Terraform"]
-            },
-            "staging@helios.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "standard",
-                "end_date": "2025-09-10",
-                "tenant": "helios-staging",
-                "customer": "Helios",
-                "features": []
-            },
-            "admin@wavecore.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "enterprise",
-                "end_date": "2025-12-05",
-                "tenant": "wavecore",
-                "customer": "WaveCore",
-                "features": ["Copilot", "FBP", "Multitenancy"]
-            },
-            "prod@neuronx.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "standard",
-                "end_date": "2025-07-20",
-                "tenant": "neuronx-prod",
-                "customer": "NeuronX",
-                "features": ["OrgOnboarding"]
-            },
-            "labs@neuronx.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "enterprise",
-                "end_date": "2025-11-01",
-                "tenant": "neuronx-labs",
-                "customer": "NeuronX",
-                "features": ["MAP", "Azure"]
-            },
-            # Add some trial customers for testing trial extensions
-            "trial@acmecorp.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "trial",
-                "end_date": "2025-07-01",
-                "tenant": "acme-trial",
-                "customer": "AcmeCorp",
-                "features": ["Copilot"]
-            },
-            "trial@zenlabs.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "trial",
-                "end_date": "2025-06-25",
-                "tenant": "zenlabs-trial",
-                "customer": "ZenLabs",
-                "features": []
-            },
-            "trial@skyai.com": {
-                "customer_id": "CUST001",
-                "signup_date": "2024-01-01",
-                "plan": "trial",
-                "end_date": "2025-07-05",
-                "tenant": "skyai-trial",
-                "customer": "SkyAI",
-                "features": ["FBP"]
-            }
-        }
-        
-        self.allowed_features = [
-            "Multitenancy", "Azure", "Copilot", "FBP", 
-            "OrgOnboarding", "MAP", "Terraform"
-        ]
+        self.mock_customers = _MOCK_CUSTOMERS
+        self.customers_by_id = _CUSTOMERS_BY_ID
+        self.allowed_features = _ALLOWED_FEATURES
 
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        # Every endpoint is mocked, so no HTTP session is opened until real calls exist
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
 
+    @_cached_by_email
     async def get_customer(self, email: str) -> Optional[Dict[str, Any]]:
         """
         Mock for GET /get-customer?email=<email>
         Returns: {"CustomerID": "CUST001", "Name": "abc", "signup_date": "2024-01-01"}
         """
         try:
-            logger.info(f"Mock GET /get-customer?email={email}")
+            logger.info("Mock GET /get-customer?email=%s", email)
             
             # Mock implementation for /get-customer endpoint
-            if email in self.mock_customers:
-                customer_data = self.mock_customers[email]
+            customer_data = self.mock_customers.get(email.casefold()) if isinstance(email, str) else None
+            if customer_data:
                 result = {
                     "CustomerID": "CUST001",  # Always use CUST001 for now
                     "Name": customer_data["customer"],
                     "signup_date": "2024-01-01"
                 }
-                logger.info(f"Found customer: {result}")
+                logger.info("Found customer: %s", result)
                 return result
             else:
-                logger.warning(f"Customer not found: {email}")
+                logger.warning("Customer not found: %s", email)
                 return None
                 
         except Exception as e:
-            logger.error(f"Error fetching customer: {e}")
+            logger.error("Error fetching customer: %s", e)
             return None
 
     async def get_subscription_details(self, customer_id: str) -> Optional[Dict[str, Any]]:
@@ -232,26 +350,19 @@ class SLMAPIClient:
         Returns: {"plan": "enterprise", "start_date": "2024-12-01", "end_date": "2025-11-01"}
         """
         try:
-            logger.info(f"Mock GET /get-subscription-details?customerid={customer_id}")
+            logger.info("Mock GET /get-subscription-details?customerid=%s", customer_id)
             
-            # Since we're using CUST001 for all customers, find the first customer in mock_customers
-            # In real implementation, this would be based on the actual customer_id
-            for email, customer_data in self.mock_customers.items():
-                if customer_id == "CUST001":  # Always match CUST001
-                    result = {
-                        "plan": customer_data["plan"],
-                        "start_date": "2024-12-01",  # Mock start date
-                        "end_date": customer_data["end_date"]
-                    }
-                    logger.info(f"Found subscription details: {result}")
-                    return result
-                break  # Only return first match since we're using fixed customer ID
+            customer_data = self.customers_by_id.get(customer_id)
+            if customer_data:
+                result = dict(_subscription_view(customer_data))
+                logger.info("Found subscription details: %s", result)
+                return result
             
-            logger.warning(f"Subscription not found for customer ID: {customer_id}")
+            logger.warning("Subscription not found for customer ID: %s", customer_id)
             return None
                 
         except Exception as e:
-            logger.error(f"Error fetching subscription details: {e}")
+            logger.error("Error fetching subscription details: %s", e)
             return None
         
 
@@ -261,46 +372,41 @@ class SLMAPIClient:
         Returns: {"tenant": "nextgen-prod", "customer": "NextGenTech", "features": ["Multitenancy", "Terraform"]}
         """
         try:
-            logger.info(f"Mock GET /get-enabled-features?customerid={customer_id}")
+            logger.info("Mock GET /get-enabled-features?customerid=%s", customer_id)
             
-            # Since we're using CUST001 for all customers, find the first customer in mock_customers
-            # In real implementation, this would be based on the actual customer_id
-            for email, customer_data in self.mock_customers.items():
-                if customer_id == "CUST001":  # Always match CUST001
-                    result = {
-                        "tenant": customer_data["tenant"],
-                        "customer": customer_data["customer"],
-                        "features": customer_data["features"]
-                    }
-                    logger.info(f"Found enabled features: {result}")
-                    return result
-                break  # Only return first match since we're using fixed customer ID
+            customer_data = self.customers_by_id.get(customer_id)
+            if customer_data:
+                result = _features_result(_features_view(customer_data))
+                logger.info("Found enabled features: %s", result)
+                return result
             
-            logger.warning(f"Features not found for customer ID: {customer_id}")
+            logger.warning("Features not found for customer ID: %s", customer_id)
             return None
                 
         except Exception as e:
-            logger.error(f"Error fetching enabled features: {e}")
+            logger.error("Error fetching enabled features: %s", e)
             return None
         
 
+    @_cached_by_email
     async def fetch_subscription_plan(self, email: str) -> Optional[Dict[str, Any]]:
         """
         Wrapper that uses the new endpoint structure
         """
         try:
-            # Step 1: Get customer info
-            customer = await self.get_customer(email)
+            # Get customer info and subscription details concurrently
+            # Pass the original email so we can find the right customer data
+            customer, subscription = await asyncio.gather(
+                self.get_customer(email),
+                self.get_subscription_details_by_email(email)
+            )
             if not customer:
                 return None
             
-            # Step 2: Get subscription details using customer ID
-            # Pass the original email so we can find the right customer data
-            subscription = await self.get_subscription_details_by_email(email)
             return subscription
                 
         except Exception as e:
-            logger.error(f"Error fetching subscription plan: {e}")
+            logger.error("Error fetching subscription plan: %s", e)
             return None
         
 
@@ -308,50 +414,37 @@ class SLMAPIClient:
         """
         Helper function to get subscription details by email (for mock purposes)
         """
-        try:
-            if email in self.mock_customers:
-                customer_data = self.mock_customers[email]
-                result = {
-                    "plan": customer_data["plan"],
-                    "start_date": "2024-12-01",  # Mock start date
-                    "end_date": customer_data["end_date"]
-                }
-                return result
+        if not isinstance(email, str):
             return None
-        except Exception as e:
-            logger.error(f"Error fetching subscription by email: {e}")
-            return None
-        
+        view = _SUBSCRIPTION_VIEWS.get(email.casefold())
+        return dict(view) if view is not None else None
 
+    @_cached_by_email
     async def get_enabled_features_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """
         Helper function to get enabled features by email (for mock purposes)
         """
-        try:
-            if email in self.mock_customers:
-                customer_data = self.mock_customers[email]
-                result = {
-                    "tenant": customer_data["tenant"],
-                    "customer": customer_data["customer"],
-                    "features": customer_data["features"]
-                }
-                return result
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching features by email: {e}")
+        if not isinstance(email, str):
             return None
-        
+        return _features_result(_FEATURE_VIEWS.get(email.casefold()))
 
     async def validate_customer(self, email: str, action_type: str) -> Dict[str, Any]:
         """
         Validate customer for a specific action and return relevant details
         """
         try:
-            logger.info(f"Validating customer {email} for action: {action_type}")
+            logger.info("Validating customer %s for action: %s", email, action_type)
+            
+            # Fetch basic customer info concurrently
+            subscription, tenant_details = await asyncio.gather(
+                self.fetch_subscription_plan(email),
+                self.get_enabled_features_by_email(email),
+                return_exceptions=True
+            )
             
-            # Fetch basic customer info
-            subscription = await self.fetch_subscription_plan(email)
-            tenant_details = await self.get_enabled_features_by_email(email)
+            for lookup in (subscription, tenant_details):
+                if isinstance(lookup, Exception):
+                    raise lookup
             
             if not subscription or not tenant_details:
                 return {
@@ -368,34 +461,24 @@ class SLMAPIClient:
                 "tenant": tenant_details["tenant"],
                 "current_plan": subscription["plan"],
                 "plan_end_date": subscription["end_date"],
-                "features": tenant_details["features"]
+                "features": list(tenant_details["features"])
             }
             
-            # Action-specific validations
-            if action_type == "extend_trial":
-                if subscription["plan"] != "trial":
-                    validation_result["valid"] = False
-                    validation_result["error"] = f"Customer is on '{subscription['plan']}' plan, not trial"
-                    validation_result["suggestion"] = "Trial extension is only available for trial customers"
-                    
-            elif action_type == "upgrade_subscription":
-                if subscription["plan"] == "enterprise":
-                    validation_result["valid"] = False
-                    validation_result["error"] = "Customer is already on enterprise plan"
-                    validation_result["suggestion"] = "Customer is already on the highest plan available"
-                    
-            elif action_type == "enable_beta_features":
-                # Any customer can request beta features
-                pass
-                
-            elif action_type == "approve_signup":
-                # Signup approval is always valid
-                pass
+            # Action-specific validations; verdicts per (plan, action) are precomputed
+            plan = subscription["plan"]
+            verdict = _ACTION_VERDICTS.get((plan, action_type))
+            if verdict is None and action_type == "extend_trial" and plan != "trial":
+                # Plan outside the precomputed table
+                verdict = (f"Customer is on '{plan}' plan, not trial", _TRIAL_ONLY_SUGGESTION)
+            
+            if verdict:
+                validation_result["valid"] = False
+                validation_result["error"], validation_result["suggestion"] = verdict
             
             return validation_result
             
         except Exception as e:
-            logger.error(f"Error validating customer: {e}")
+            logger.error("Error validating customer: %s", e)
             return {
                 "valid": False,
                 "error": f"Validation failed: {str(e)}",
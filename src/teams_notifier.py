@@ -3,27 +3,171 @@ Teams proactive messaging module for sending notifications to users.
 """
 
 import os
+import time
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 from botbuilder.core import BotFrameworkAdapter, TurnContext, MessageFactory
-from botbuilder.schema import ConversationReference
+from botbuilder.schema import ChannelAccount, ConversationAccount, ConversationReference
 from config import Config
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Logging is configured by the application entry point
 logger = logging.getLogger(__name__)
 
-# Dictionary to store conversation references by ticket key and user ID
-# Format: {ticket_key: ConversationReference}
-CONVERSATION_REFERENCES: Dict[str, ConversationReference] = {}
-USER_INITIATED_TICKETS: Dict[str, str] = {}  # Maps ticket_key to user_id
+class MiniRef:
+    """The parts of a ConversationReference needed to continue a conversation"""
+    
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10+
+    __slots__ = ("conv_id", "conv_type", "tenant_id", "service_url", "channel_id", "bot_id", "user_id")
+    
+    def __init__(self, conv_id: str, conv_type: Optional[str], tenant_id: Optional[str],
+                 service_url: str, channel_id: str, bot_id: Optional[str], user_id: Optional[str]):
+        self.conv_id = conv_id
+        self.conv_type = conv_type
+        self.tenant_id = tenant_id
+        self.service_url = service_url
+        self.channel_id = channel_id
+        self.bot_id = bot_id
+        self.user_id = user_id
+    
+    def __repr__(self) -> str:
+        return f"MiniRef(conv_id={self.conv_id!r}, conv_type={self.conv_type!r}, service_url={self.service_url!r})"
+    
+    @classmethod
+    def from_reference(cls, reference: ConversationReference) -> "MiniRef":
+        conversation = reference.conversation
+        return cls(
+            conv_id=conversation.id,
+            conv_type=conversation.conversation_type,
+            tenant_id=conversation.tenant_id,
+            service_url=reference.service_url,
+            channel_id=reference.channel_id,
+            bot_id=reference.bot.id if reference.bot else None,
+            user_id=reference.user.id if reference.user else None
+        )
+    
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Identity of the conversation, (conversation id, conversation type)"""
+        return (self.conv_id, self.conv_type)
+    
+    def hydrate(self) -> ConversationReference:
+        """Rebuild a full ConversationReference for continue_conversation"""
+        return ConversationReference(
+            channel_id=self.channel_id,
+            service_url=self.service_url,
+            conversation=ConversationAccount(
+                id=self.conv_id,
+                conversation_type=self.conv_type,
+                tenant_id=self.tenant_id
+            ),
+            bot=ChannelAccount(id=self.bot_id),
+            user=ChannelAccount(id=self.user_id)
+        )
+
+class ConvRefStore:
+    """
+    Conversation references by ticket key, safe to share between asyncio tasks.
+    
+    Writes are serialized with an asyncio.Lock; readers take a snapshot once
+    and iterate that instead of the live dictionaries. References are kept as
+    MiniRef records and hydrated only when a message is actually sent.
+    """
+    
+    def __init__(self):
+        self._refs: Dict[str, MiniRef] = {}
+        self._user_ids: Dict[str, str] = {}  # Maps ticket_key to user_id
+        # Unique conversations keyed by (conversation id, conversation type)
+        self._unique: Dict[Tuple[str, str], MiniRef] = {}
+        self._ticket_counts: Dict[Tuple[str, str], int] = {}  # Tickets referencing each conversation
+        self._lock = asyncio.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._refs)
+    
+    def get(self, ticket_key: str) -> Optional[ConversationReference]:
+        """Conversation reference stored for a ticket, if any"""
+        mini_ref = self._refs.get(ticket_key)
+        return mini_ref.hydrate() if mini_ref is not None else None
+    
+    def get_mini_ref(self, ticket_key: str) -> Optional[MiniRef]:
+        """Compact reference stored for a ticket, if any, without hydrating it"""
+        return self._refs.get(ticket_key)
+    
+    def get_user_id(self, ticket_key: str) -> Optional[str]:
+        """User who initiated a ticket, if recorded"""
+        return self._user_ids.get(ticket_key)
+    
+    def snapshot(self) -> Dict[str, MiniRef]:
+        """Point-in-time copy of the ticket -> reference map"""
+        return self._refs.copy()
+    
+    def unique_snapshot(self) -> Dict[Tuple[str, str], MiniRef]:
+        """Point-in-time copy of the unique conversation index"""
+        return self._unique.copy()
+    
+    async def set(self, ticket_key: str, reference: ConversationReference, user_id: str = None):
+        """Store the reference for a ticket, replacing any earlier one"""
+        async with self._lock:
+            previous = self._refs.get(ticket_key)
+            if previous is not None:
+                self._release(previous)
+            
+            mini_ref = MiniRef.from_reference(reference)
+            self._refs[ticket_key] = mini_ref
+            conv_key = mini_ref.key
+            self._unique[conv_key] = mini_ref
+            self._ticket_counts[conv_key] = self._ticket_counts.get(conv_key, 0) + 1
+            
+            if user_id:
+                self._user_ids[ticket_key] = user_id
+    
+    async def remove(self, ticket_key: str) -> bool:
+        """Forget the reference for a ticket; returns False if none was stored"""
+        async with self._lock:
+            mini_ref = self._refs.pop(ticket_key, None)
+            self._user_ids.pop(ticket_key, None)
+            
+            if mini_ref is None:
+                return False
+            
+            self._release(mini_ref)
+            return True
+    
+    def _release(self, mini_ref: MiniRef):
+        """Drop one ticket's claim on a conversation, removing it once unreferenced"""
+        conv_key = mini_ref.key
+        remaining = self._ticket_counts.get(conv_key, 0) - 1
+        if remaining > 0:
+            self._ticket_counts[conv_key] = remaining
+        else:
+            self._ticket_counts.pop(conv_key, None)
+            self._unique.pop(conv_key, None)
+
+# Conversation references for proactive messages, keyed by ticket key
+CONVERSATION_STORE = ConvRefStore()
+
+# Recently delivered (ticket_key, conversation_id, message hash) triples, cleared hourly
+_RECENT_SENDS_TTL = 3600
+_RECENT_SENDS = set()
+_recent_sends_reset_at = time.monotonic() + _RECENT_SENDS_TTL
+
+def _recent_sends() -> set:
+    """Return the duplicate-suppression set, clearing it once its TTL has passed"""
+    global _recent_sends_reset_at
+    now = time.monotonic()
+    if now >= _recent_sends_reset_at:
+        _RECENT_SENDS.clear()
+        _recent_sends_reset_at = now + _RECENT_SENDS_TTL
+    return _RECENT_SENDS
 
 class TeamsNotifier:
     """Handles proactive messaging to Teams users"""
     
-    def __init__(self, adapter: BotFrameworkAdapter):
-        """Initialize with bot adapter"""
+    def __init__(self, adapter: BotFrameworkAdapter, store: ConvRefStore = None):
+        """Initialize with bot adapter (anything exposing continue_conversation) and reference store"""
         self.adapter = adapter
+        self.store = store if store is not None else CONVERSATION_STORE
         
     async def send_notification(self, ticket_key: str, message: str) -> bool:
         """
@@ -38,24 +182,21 @@ class TeamsNotifier:
         """
         try:
             # Try to get the conversation reference for this ticket
-            conversation_ref = CONVERSATION_REFERENCES.get(ticket_key)
+            mini_ref = self.store.get_mini_ref(ticket_key)
             
-            if not conversation_ref:
-                logger.warning(f"No conversation reference found for ticket {ticket_key}")
+            if mini_ref is None:
+                logger.warning("No conversation reference found for ticket %s", ticket_key)
                 return False
             
-            # Send the message using the stored conversation reference
-            await self.adapter.continue_conversation(
-                conversation_ref,
-                lambda turn_context: self._send_message(turn_context, message),
-                Config.APP_ID
-            )
+            # Send through broadcast so repeat ticket notifications are still suppressed
+            if not await self.broadcast(message, ticket_key, {mini_ref.key: mini_ref}):
+                return False
             
-            logger.info(f"Proactive notification sent for ticket {ticket_key}")
+            logger.info("Proactive notification sent for ticket %s", ticket_key)
             return True
             
         except Exception as e:
-            logger.error(f"Error sending proactive notification: {e}")
+            logger.error("Error sending proactive notification: %s", e)
             return False
     
     async def _send_message(self, turn_context: TurnContext, message: str):
@@ -72,30 +213,71 @@ class TeamsNotifier:
         Returns:
             int: Number of users notified
         """
-        sent_count = 0
-        unique_refs = set()
-        
-        # Deduplicate conversation references by conversation ID
-        for ref in CONVERSATION_REFERENCES.values():
-            # Create a unique key for this conversation to avoid duplicates
-            conv_key = f"{ref.conversation.id}:{ref.conversation.conversation_type}"
-            if conv_key not in unique_refs:
-                unique_refs.add(conv_key)
-                
-                try:
-                    # Send message to this unique conversation
-                    await self.adapter.continue_conversation(
-                        ref,
-                        lambda turn_context: self._send_message(turn_context, message),
-                        Config.APP_ID
-                    )
-                    sent_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to send message to conversation {conv_key}: {e}")
+        return await self.broadcast(message)
+    
+    async def broadcast(self, message: str, ticket_key: str = None,
+                        conversations: Dict[Tuple[str, str], MiniRef] = None) -> int:
+        """
+        Send a message to every unique conversation concurrently
+        
+        Args:
+            message: The message to send
+            ticket_key: Optional ticket key; repeat sends of the same ticket message are skipped
+            conversations: Conversations to send to, defaults to a snapshot of CONVERSATION_STORE
+            
+        Returns:
+            int: Number of conversations notified
+        """
+        if conversations is None:
+            conversations = self.store.unique_snapshot()
+        if not conversations:
+            return 0
+        
+        if Config.DEBUG:
+            print(f"🔄 Attempting to send notification to {len(conversations)} active conversations...")
+        
+        # Build the activity and callback once; the SDK copies the activity per send
+        message_activity = MessageFactory.text(message)
+        
+        async def send_proactive(turn_context: TurnContext):
+            await turn_context.send_activity(message_activity)
+        
+        # Only ticket notifications are deduplicated; ad-hoc broadcasts always go out
+        recent_sends = _recent_sends() if ticket_key else None
+        message_hash = hash(message)
+        
+        async def send_one(mini_ref: MiniRef) -> bool:
+            send_key = (ticket_key, mini_ref.conv_id, message_hash)
+            if recent_sends is not None and send_key in recent_sends:
+                logger.info("Skipping duplicate notification for ticket %s to conversation %s",
+                            ticket_key, mini_ref.conv_id)
+                return True
+            
+            try:
+                # Send message to this unique conversation
+                await self.adapter.continue_conversation(
+                    mini_ref.hydrate(),
+                    send_proactive,
+                    Config.APP_ID
+                )
+            except Exception as e:
+                logger.error("Failed to send message to conversation %s: %s", mini_ref.key, e)
+                return False
+            
+            if recent_sends is not None:
+                recent_sends.add(send_key)
+            return True
         
+        # Send to all unique conversations concurrently
+        results = await asyncio.gather(
+            *(send_one(mini_ref) for mini_ref in conversations.values()),
+            return_exceptions=True
+        )
+        sent_count = sum(1 for result in results if result is True)
+        logger.info("Broadcast: %d/%d conversations succeeded", sent_count, len(conversations))
         return sent_count
 
-def store_conversation_reference(ticket_key: str, reference: ConversationReference, user_id: str = None):
+async def store_conversation_reference(ticket_key: str, reference: ConversationReference, user_id: str = None):
     """
     Store a conversation reference for future proactive messages
     
@@ -104,13 +286,27 @@ def store_conversation_reference(ticket_key: str, reference: ConversationReferen
         reference: The conversation reference object
         user_id: Optional user ID for tracking who initiated the ticket
     """
-    CONVERSATION_REFERENCES[ticket_key] = reference
+    await CONVERSATION_STORE.set(ticket_key, reference, user_id)
     
     if user_id:
-        USER_INITIATED_TICKETS[ticket_key] = user_id
-        logger.info(f"Stored conversation reference for ticket {ticket_key} initiated by user {user_id}")
+        logger.info("Stored conversation reference for ticket %s initiated by user %s", ticket_key, user_id)
     else:
-        logger.info(f"Stored conversation reference for ticket {ticket_key}")
+        logger.info("Stored conversation reference for ticket %s", ticket_key)
+
+async def remove_conversation_reference(ticket_key: str) -> bool:
+    """
+    Forget the conversation reference stored for a ticket
+    
+    Args:
+        ticket_key: The JIRA ticket key (e.g., CST-123)
+        
+    Returns:
+        bool: True if a reference was removed, False if none was stored
+    """
+    removed = await CONVERSATION_STORE.remove(ticket_key)
+    if removed:
+        logger.info("Removed conversation reference for ticket %s", ticket_key)
+    return removed
 
 # Global notifier instance (initialized later)
 teams_notifier = None
@@ -121,106 +317,137 @@ def initialize_teams_notifier(adapter: BotFrameworkAdapter):
     teams_notifier = TeamsNotifier(adapter)
     return teams_notifier
 
-# async def send_teams_notification(message: str, ticket_key: str = None):
-#     """
-#     Send a Teams notification that the ticket is approved
-    
-#     Args:
-#         message: The message to send
-#         ticket_key: Optional ticket key to target specific user
-#     """
-#     global teams_notifier
-    
-#     if not teams_notifier:
-#         logger.error("Teams notifier not initialized. Call initialize_teams_notifier first.")
-#         return False
+async def send_teams_notification(message_text: str, ticket_key: str = None, *,
+                                  adapter: BotFrameworkAdapter,
+                                  conversation_references: ConvRefStore) -> bool:
+    """
+    Send proactive notification to Teams
     
-#     if ticket_key:
-#         # Send to specific user who initiated this ticket
-#         return await teams_notifier.send_notification(ticket_key, message)
-#     else:
-#         # Send to all users (broadcast)
-#         sent_count = await teams_notifier.send_to_all_users(message)
-#         return sent_count > 0
-
-
-async def send_teams_notification(message_text: str, ticket_key: str = None) -> bool:
-    """Send proactive notification to Teams"""
+    The adapter and reference store are injected by the caller; app.py binds
+    them once with functools.partial.
+    """
     try:
-        # Try different import patterns to find the correct one
-        conversation_references = None
-        adapter = None
-        
-        try:
-            from bot import conversation_references, adapter
-        except ImportError as e1:
-            print(f"Import attempt 1 failed: {e1}")
-            try:
-                import bot
-                conversation_references = getattr(bot, 'conversation_references', None)
-                adapter = getattr(bot, 'adapter', None)
-            except Exception as e2:
-                print(f"Import attempt 2 failed: {e2}")
-                try:
-                    # Try importing the bot instance and get attributes
-                    from bot import bot_instance
-                    conversation_references = getattr(bot_instance, 'conversation_references', {})
-                    adapter = getattr(bot_instance, 'adapter', None)
-                except Exception as e3:
-                    print(f"Import attempt 3 failed: {e3}")
-                    # Last resort - check if there's a global variable
-                    try:
-                        import sys
-                        bot_module = sys.modules.get('bot')
-                        if bot_module:
-                            conversation_references = getattr(bot_module, 'conversation_references', {})
-                            adapter = getattr(bot_module, 'adapter', None)
-                    except Exception as e4:
-                        print(f"All import attempts failed: {e4}")
-        
         if not conversation_references:
             logger.warning("No conversation references available for proactive messaging")
-            print(f"📢 TEAMS MESSAGE (No conversation available): {message_text}")
+            if Config.DEBUG:
+                print(f"📢 TEAMS MESSAGE (No conversation available): {message_text}")
             return False
         
         if not adapter:
             logger.error("Bot adapter not available for proactive messaging")
-            print(f"📢 TEAMS MESSAGE (No adapter available): {message_text}")
+            if Config.DEBUG:
+                print(f"📢 TEAMS MESSAGE (No adapter available): {message_text}")
             return False
         
-        # Send to ALL active conversations instead of looking for specific ticket
-        success_count = 0
-        total_conversations = len(conversation_references)
+        notifier = TeamsNotifier(adapter, conversation_references)
         
-        print(f"🔄 Attempting to send notification to {total_conversations} active conversations...")
+        # Ticket notifications go only to the conversation that raised the ticket
+        if ticket_key and conversation_references.get_mini_ref(ticket_key) is not None:
+            return await notifier.send_notification(ticket_key, message_text)
         
-        for conv_id, conversation_reference in conversation_references.items():
-            try:
-                message_activity = MessageFactory.text(message_text)
-                
-                async def send_proactive(turn_context):
-                    await turn_context.send_activity(message_activity)
-                
-                await adapter.continue_conversation(
-                    conversation_reference,
-                    send_proactive
-                )
-                
-                success_count += 1
-                print(f"✅ TEAMS MESSAGE SENT to conversation {conv_id}")
-                
-            except Exception as conv_error:
-                logger.error(f"Error sending to conversation {conv_id}: {conv_error}")
-                continue
-        
-        if success_count > 0:
-            logger.info(f"Proactive Teams message sent to {success_count}/{total_conversations} conversations")
-            return True
-        else:
+        # Otherwise send to ALL active conversations
+        sent_count = await notifier.broadcast(message_text, ticket_key)
+        
+        if sent_count == 0:
             logger.warning("Failed to send message to any conversation")
-            return False
+        return sent_count > 0
             
     except Exception as e:
-        logger.error(f"Error in send_teams_notification: {e}")
-        print(f"📢 TEAMS MESSAGE (Error occurred): {message_text}")
-        return False
\ No newline at end of file
+        logger.error("Error in send_teams_notification: %s", e)
+        if Config.DEBUG:
+            print(f"📢 TEAMS MESSAGE (Error occurred): {message_text}")
+        return False
+
+
+# Webhook notifications arriving within this window are coalesced into one send per ticket
+_FLUSH_INTERVAL = 0.05  # seconds
+_FLUSH_MAX_BATCH = 20
+_DIGEST_SEPARATOR = "\n\n---\n\n"
+_STOP = object()  # Queue sentinel telling the flusher to exit
+
+_pending: Optional[asyncio.Queue] = None
+_flusher: Optional[asyncio.Task] = None
+_flush_send: Optional[Callable[..., Awaitable[bool]]] = None
+
+def queue_teams_notification(message_text: str, ticket_key: str = None, *,
+                             send: Callable[..., Awaitable[bool]]):
+    """
+    Queue a notification to go out with the next coalesced broadcast.
+    Must be called from within the running event loop.
+    
+    Args:
+        message_text: The message to send
+        ticket_key: Optional ticket key the message relates to
+        send: Bound send_teams_notification used to deliver the batch
+    """
+    global _pending, _flusher, _flush_send
+    _flush_send = send
+    if _pending is None:
+        _pending = asyncio.Queue()
+    if _flusher is None or _flusher.done():
+        _flusher = asyncio.get_running_loop().create_task(_flush_pending())
+    _pending.put_nowait((ticket_key, message_text))
+
+async def _flush_pending():
+    """Drain queued notifications in small batches and send each ticket's share of a batch once"""
+    loop = asyncio.get_running_loop()
+    # One get() stays outstanding across batches; cancelling it on a timeout could
+    # drop an item that is handed over just as the timeout fires
+    getter = None
+    while True:
+        if getter is None:
+            getter = loop.create_task(_pending.get())
+        item = await getter
+        getter = None
+        if item is _STOP:
+            return
+        batch = [item]
+        deadline = loop.time() + _FLUSH_INTERVAL
+        stopping = False
+        
+        while len(batch) < _FLUSH_MAX_BATCH:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            getter = loop.create_task(_pending.get())
+            done, _ = await asyncio.wait((getter,), timeout=remaining)
+            if not done:
+                break
+            item = getter.result()
+            getter = None
+            if item is _STOP:
+                stopping = True
+                break
+            batch.append(item)
+        
+        # Coalesce per ticket so each digest keeps its ticket key for targeting and duplicate suppression
+        digests: Dict[Optional[str], list] = {}
+        for ticket_key, message in batch:
+            digests.setdefault(ticket_key, []).append(message)
+        
+        results = await asyncio.gather(
+            *(_flush_send(_DIGEST_SEPARATOR.join(messages), ticket_key) for ticket_key, messages in digests.items()),
+            return_exceptions=True
+        )
+        for ticket_key, result in zip(digests, results):
+            if isinstance(result, Exception):
+                logger.error("Error flushing queued Teams notifications for ticket %s: %s", ticket_key, result)
+            elif result:
+                logger.info("Sent queued Teams notification for ticket %s", ticket_key)
+            else:
+                logger.warning("Queued Teams notification for ticket %s was not delivered", ticket_key)
+        
+        if stopping:
+            return
+
+async def stop_notification_flusher():
+    """Send anything still queued and stop the background flusher"""
+    global _flusher
+    if _flusher is None or _flusher.done():
+        _flusher = None
+        return
+    
+    # The flusher delivers everything queued ahead of the sentinel, then exits
+    _pending.put_nowait(_STOP)
+    await _flusher
+    _flusher = None
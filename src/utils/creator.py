@@ -1,4 +1,5 @@
 import asyncio, os, argparse
+from pathlib import Path
 from teams.ai.planners import AssistantsPlanner
 from openai.types.beta import AssistantCreateParams
 from openai.types.beta.function_tool_param import FunctionToolParam
@@ -6,7 +7,203 @@ from openai.types.shared_params import FunctionDefinition
 
 from dotenv import load_dotenv
 
-load_dotenv(f'{os.getcwd()}/env/.env.local.user', override=True)
+# Resolve the env file relative to the project root rather than the working directory
+load_dotenv(Path(__file__).resolve().parents[2] / 'env' / '.env.local.user', override=True)
+
+_ENDPOINT = os.getenv('AZURE_OPENAI_ENDPOINT')
+_MODEL = os.getenv('AZURE_OPENAI_MODEL_DEPLOYMENT_NAME')
+
+# Assistant definition, built once at import
+_INSTRUCTIONS = "\n".join([
+    "You are a comprehensive customer support bot for MontyCloud. You automate critical customer support workflows for the Customer Success team.",
+    "",
+    "CORE FUNCTIONS:",
+    "1. approve_signup - Approve and activate new customer signups",
+    "2. extend_trial - Extend trial duration for customers", 
+    "3. enable_beta_features - Enable specific MSP features for customers",
+    "4. upgrade_subscription - Convert subscription from standard to enterprise",
+    "5. get_customer_info - Query current subscription plan, trial dates, and customer details",
+    "6. update_jira - Log all actions for audit and traceability",
+    "",
+    "WORKFLOW REQUIREMENTS:",
+    "• Always validate customer email format and subscription status",
+    "• Ask clarifying questions when request details are ambiguous, by natural language should be able to identify the date in any format given",
+    "• BEFORE creating any JIRA ticket, ALWAYS:",
+    "  1. Fetch customer data from SLM API to verify customer exists",
+    "  2. Show the customer's current information (name, plan, end date, features)",
+    "  3. Show the requested action details",
+    "  4. Ask for explicit confirmation: 'Can I proceed with this information?'",
+    "• Do not proceed with creation of Jira ticket until the customer confirms the data, ask a yes or no or confirm or proceed",
+    "• Each main function (approve_signup, extend_trial, enable_beta_features, upgrade_subscription) automatically creates its own JIRA ticket - DO NOT call update_jira separately",
+    "• If list of beta features are asked it is Multitenancy, Azure, Copilot, FBP, OrgOnboarding, MAP, Terraform",
+    "• Provide clear status updates with ticket references",
+    "• if all tasks agent can perform is asked as a user query, do not mention jira ticket management or anything about jira"
+    "",
+    "VALIDATION RULES:",
+    "• Email must contain @ symbol and valid domain",
+    "• Plan types: standard, enterprise", 
+    "• Upgrade paths: standard→enterprise",
+    "• Dates support NATURAL LANGUAGE: Accept '20th June 2025', 'June 20, 2025', 'next month', 'in 30 days', etc. - NEVER ask for YYYY-MM-DD format",
+    "",
+    "INTERACTION STYLE:",
+    "• Be professional and helpful",
+    "• Use emojis for visual clarity (📧 for email, 🎫 for tickets, ✅ for success)",
+    "• Always provide next steps and expected timeline",
+    "• Handle natural language queries intelligently",
+    "• When users provide dates like '20th June 2025' or 'next month', accept them directly - DO NOT ask for YYYY-MM-DD format"
+])
+
+_TOOLS = [
+    {
+        "type": "code_interpreter",
+    },
+    FunctionToolParam(
+        type="function",
+        function=FunctionDefinition(
+            name="approve_signup",
+            description="Approve and activate new customer signup",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "email": {
+                        "type": "string",
+                        "description": "Customer email address",
+                    },
+                    "company_name": {
+                        "type": "string", 
+                        "description": "Company name for the new customer",
+                    },
+                    "plan_type": {
+                        "type": "string",
+                        "description": "Initial plan type ( standard, enterprise)",
+                        "enum": ["standard", "enterprise"]
+                    },
+                },
+                "required": ["email", "company_name"],
+            }
+        )
+    ),
+    FunctionToolParam(
+        type="function",
+        function=FunctionDefinition(
+            name="extend_trial",
+            description="Extend trial period for a customer",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "email": {
+                        "type": "string",
+                        "description": "Customer email address",
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "New trial end date. Accepts natural language like '20th June 2025', 'June 20, 2025', 'next month', 'in 30 days'. Do NOT require YYYY-MM-DD format.",
+                    },
+                },
+                "required": ["email", "end_date"],
+            }
+        )
+    ),
+    FunctionToolParam(
+        type="function",
+        function=FunctionDefinition(
+            name="enable_beta_features",
+            description="Enable beta features for a customer",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "email": {
+                        "type": "string",
+                        "description": "Customer email address",
+                    },
+                    "features": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of beta features to enable",
+                    },
+                },
+                "required": ["email", "features"],
+            }
+        )
+    ),
+    FunctionToolParam(
+        type="function",
+        function=FunctionDefinition(
+            name="upgrade_subscription",
+            description="Upgrade customer subscription from current plan to target plan",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "email": {
+                        "type": "string",
+                        "description": "Customer email address",
+                    },
+                    "current_plan": {
+                        "type": "string",
+                        "description": "Current subscription plan",
+                        "enum": ["standard", "enterprise"]
+                    },
+                    "target_plan": {
+                        "type": "string", 
+                        "description": "Target subscription plan",
+                        "enum": ["standard", "enterprise"]
+                    },
+                    "effective_date": {
+                        "type": "string",
+                        "description": "Effective date for upgrade. Accepts natural language like '20th June 2025', 'June 20, 2025', 'next month', 'in 30 days'. Do NOT require YYYY-MM-DD format.",
+                    },
+                },
+                "required": ["email", "current_plan", "target_plan", "effective_date"],
+            }
+        )
+    ),
+    FunctionToolParam(
+        type="function",
+        function=FunctionDefinition(
+            name="get_customer_info",
+            description="Query current subscription plan, trial dates, and customer details",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "email": {
+                        "type": "string",
+                        "description": "Customer email address to lookup",
+                    },
+                },
+                "required": ["email"],
+            }
+        )
+    ),
+    FunctionToolParam(
+        type="function",
+        function=FunctionDefinition(
+            name="update_jira",
+            description="Create or update JIRA ticket for tracking",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "action": {
+                        "type": "string",
+                        "description": "Action being performed (approve_signup, extend_trial, enable_beta_features, upgrade_subscription)",
+                    },
+                    "email": {
+                        "type": "string",
+                        "description": "Customer email address",
+                    },
+                    "status": {
+                        "type": "string",
+                        "description": "Current status (pending, in-progress, complete, error)",
+                    },
+                    "details": {
+                        "type": "string",
+                        "description": "Additional details about the action",
+                    },
+                },
+                "required": ["action", "email", "status"],
+            }
+        )
+    )           
+]
 
 def load_keys_from_args():
     parser = argparse.ArgumentParser(description='Load keys from command input parameters.')
@@ -18,202 +215,15 @@ async def main():
     args = load_keys_from_args()
 
     # Debug: Print environment variables
-    print(f"Endpoint: {os.getenv('AZURE_OPENAI_ENDPOINT')}")
-    print(f"Model: {os.getenv('AZURE_OPENAI_MODEL_DEPLOYMENT_NAME')}")
+    print(f"Endpoint: {_ENDPOINT}")
+    print(f"Model: {_MODEL}")
     print(f"API Key (first 10 chars): {args.api_key[:10]}...")
 
     options = AssistantCreateParams(
         name="MontyCloud Customer Support Bot",
-        instructions="\n".join([
-            "You are a comprehensive customer support bot for MontyCloud. You automate critical customer support workflows for the Customer Success team.",
-            "",
-            "CORE FUNCTIONS:",
-            "1. approve_signup - Approve and activate new customer signups",
-            "2. extend_trial - Extend trial duration for customers", 
-            "3. enable_beta_features - Enable specific MSP features for customers",
-            "4. upgrade_subscription - Convert subscription from standard to enterprise",
-            "5. get_customer_info - Query current subscription plan, trial dates, and customer details",
-            "6. update_jira - Log all actions for audit and traceability",
-            "",
-            "WORKFLOW REQUIREMENTS:",
-            "• Always validate customer email format and subscription status",
-            "• Ask clarifying questions when request details are ambiguous, by natural language should be able to identify the date in any format given",
-            "• BEFORE creating any JIRA ticket, ALWAYS:",
-            "  1. Fetch customer data from SLM API to verify customer exists",
-            "  2. Show the customer's current information (name, plan, end date, features)",
-            "  3. Show the requested action details",
-            "  4. Ask for explicit confirmation: 'Can I proceed with this information?'",
-            "• Do not proceed with creation of Jira ticket until the customer confirms the data, ask a yes or no or confirm or proceed",
-            "• Each main function (approve_signup, extend_trial, enable_beta_features, upgrade_subscription) automatically creates its own JIRA ticket - DO NOT call update_jira separately",
-            "• If list of beta features are asked it is Multitenancy, Azure, Copilot, FBP, OrgOnboarding, MAP, Terraform",
-            "• Provide clear status updates with ticket references",
-            "• if all tasks agent can perform is asked as a user query, do not mention jira ticket management or anything about jira"
-            "",
-            "VALIDATION RULES:",
-            "• Email must contain @ symbol and valid domain",
-            "• Plan types: standard, enterprise", 
-            "• Upgrade paths: standard→enterprise",
-            "• Dates support NATURAL LANGUAGE: Accept '20th June 2025', 'June 20, 2025', 'next month', 'in 30 days', etc. - NEVER ask for YYYY-MM-DD format",
-            "",
-            "INTERACTION STYLE:",
-            "• Be professional and helpful",
-            "• Use emojis for visual clarity (📧 for email, 🎫 for tickets, ✅ for success)",
-            "• Always provide next steps and expected timeline",
-            "• Handle natural language queries intelligently",
-            "• When users provide dates like '20th June 2025' or 'next month', accept them directly - DO NOT ask for YYYY-MM-DD format"
-        ]),
-        tools=[
-            {
-                "type": "code_interpreter",
-            },
-            FunctionToolParam(
-                type="function",
-                function=FunctionDefinition(
-                    name="approve_signup",
-                    description="Approve and activate new customer signup",
-                    parameters={
-                        "type": "object",
-                        "properties": {
-                            "email": {
-                                "type": "string",
-                                "description": "Customer email address",
-                            },
-                            "company_name": {
-                                "type": "string", 
-                                "description": "Company name for the new customer",
-                            },
-                            "plan_type": {
-                                "type": "string",
-                                "description": "Initial plan type ( standard, enterprise)",
-                                "enum": ["standard", "enterprise"]
-                            },
-                        },
-                        "required": ["email", "company_name"],
-                    }
-                )
-            ),
-            FunctionToolParam(
-                type="function",
-                function=FunctionDefinition(
-                    name="extend_trial",
-                    description="Extend trial period for a customer",
-                    parameters={
-                        "type": "object",
-                        "properties": {
-                            "email": {
-                                "type": "string",
-                                "description": "Customer email address",
-                            },
-                            "end_date": {
-                                "type": "string",
-                                "description": "New trial end date. Accepts natural language like '20th June 2025', 'June 20, 2025', 'next month', 'in 30 days'. Do NOT require YYYY-MM-DD format.",
-                            },
-                        },
-                        "required": ["email", "end_date"],
-                    }
-                )
-            ),
-            FunctionToolParam(
-                type="function",
-                function=FunctionDefinition(
-                    name="enable_beta_features",
-                    description="Enable beta features for a customer",
-                    parameters={
-                        "type": "object",
-                        "properties": {
-                            "email": {
-                                "type": "string",
-                                "description": "Customer email address",
-                            },
-                            "features": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of beta features to enable",
-                            },
-                        },
-                        "required": ["email", "features"],
-                    }
-                )
-            ),
-            FunctionToolParam(
-                type="function",
-                function=FunctionDefinition(
-                    name="upgrade_subscription",
-                    description="Upgrade customer subscription from current plan to target plan",
-                    parameters={
-                        "type": "object",
-                        "properties": {
-                            "email": {
-                                "type": "string",
-                                "description": "Customer email address",
-                            },
-                            "current_plan": {
-                                "type": "string",
-                                "description": "Current subscription plan",
-                                "enum": ["standard", "enterprise"]
-                            },
-                            "target_plan": {
-                                "type": "string", 
-                                "description": "Target subscription plan",
-                                "enum": ["standard", "enterprise"]
-                            },
-                            "effective_date": {
-                                "type": "string",
-                                "description": "Effective date for upgrade. Accepts natural language like '20th June 2025', 'June 20, 2025', 'next month', 'in 30 days'. Do NOT require YYYY-MM-DD format.",
-                            },
-                        },
-                        "required": ["email", "current_plan", "target_plan", "effective_date"],
-                    }
-                )
-            ),
-            FunctionToolParam(
-                type="function",
-                function=FunctionDefinition(
-                    name="get_customer_info",
-                    description="Query current subscription plan, trial dates, and customer details",
-                    parameters={
-                        "type": "object",
-                        "properties": {
-                            "email": {
-                                "type": "string",
-                                "description": "Customer email address to lookup",
-                            },
-                        },
-                        "required": ["email"],
-                    }
-                )
-            ),
-            FunctionToolParam(
-                type="function",
-                function=FunctionDefinition(
-                    name="update_jira",
-                    description="Create or update JIRA ticket for tracking",
-                    parameters={
-                        "type": "object",
-                        "properties": {
-                            "action": {
-                                "type": "string",
-                                "description": "Action being performed (approve_signup, extend_trial, enable_beta_features, upgrade_subscription)",
-                            },
-                            "email": {
-                                "type": "string",
-                                "description": "Customer email address",
-                            },
-                            "status": {
-                                "type": "string",
-                                "description": "Current status (pending, in-progress, complete, error)",
-                            },
-                            "details": {
-                                "type": "string",
-                                "description": "Additional details about the action",
-                            },
-                        },
-                        "required": ["action", "email", "status"],
-                    }
-                )
-            )           
-        ],
-        model=os.getenv("AZURE_OPENAI_MODEL_DEPLOYMENT_NAME"),
+        instructions=_INSTRUCTIONS,
+        tools=_TOOLS,
+        model=_MODEL,
     )
 
     print("Creating assistant...")
@@ -223,7 +233,7 @@ async def main():
             azure_ad_token_provider=None,
             api_version="2024-02-15-preview", 
             organization="", 
-            endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"), 
+            endpoint=_ENDPOINT, 
             request=options
         )
         
@@ -1,7 +1,12 @@
 import re
+from functools import lru_cache
 from datetime import datetime, date, timedelta
-from typing import Optional, Tuple
-import calendar
+from typing import List, Optional, Tuple
+
+def _shift_month(year: int, month: int, months: int) -> Tuple[int, int]:
+    """Return the (year, month) that lies the given number of months after year/month"""
+    year_offset, month_index = divmod(month - 1 + months, 12)
+    return year + year_offset, month_index + 1
 
 class DateParser:
     """
@@ -19,22 +24,47 @@ class DateParser:
         'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
         'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12    }
     
-    def __init__(self):
-        # Pre-compile regex patterns for better performance
-        self.iso_pattern = re.compile(r'^\d{4}-\d{2}-\d{2}$')
-        self.ordinal_pattern = re.compile(r'(\d{1,2})(st|nd|rd|th)\s+(\w+)\s+(\d{4})')
-        self.standard_pattern = re.compile(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})')
-        self.reverse_pattern = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
-        self.short_pattern = re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})')
-        self.space_pattern = re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})')  # "20 June 2025"
-        self.dot_pattern = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{4})')   # "20.06.2025"
+    # Fixed relative phrases, each mapping today's date to the target date
+    RELATIVE_DATES = {
+        'today': lambda today: today,
+        'tomorrow': lambda today: today + timedelta(days=1),
+        'yesterday': lambda today: today - timedelta(days=1),
+        'next week': lambda today: today + timedelta(weeks=1),
+        # First day of next month
+        'next month': lambda today: date(*_shift_month(today.year, today.month, 1), 1),
+        'next year': lambda today: date(today.year + 1, today.month, today.day),
+    }
+    
+    # Furthest a validated future date may be, in days (2 years)
+    MAX_FUTURE_DAYS = 730
+    
+    # Separators of the numeric formats: '/' is month first, '-' and '.' are day first
+    NUMERIC_SEPARATORS = frozenset('/-.')
+    
+    # Numeric offsets like "in 30 days", "2 weeks" or "3 months"
+    RELATIVE_OFFSET_PATTERN = re.compile(r'(?P<count>\d+)\s*(?P<unit>day|week|month)s?')
     
-    def parse_date(self, date_input: str) -> Tuple[bool, str, Optional[str]]:
+    # Pre-compile regex patterns once at import for better performance
+    # Ordinal suffixes are stripped up front so "20th June 2025" is handled as "20 June 2025"
+    ORDINAL_SUFFIX_PATTERN = re.compile(r'(\d{1,2})(?:st|nd|rd|th)\b')
+    # Every other format in one alternation, tried in priority order at each position.
+    # Text months are matched against MONTH_NAMES directly; numeric formats only at the start.
+    _MONTH_ALTERNATION = '|'.join(sorted(MONTH_NAMES, key=len, reverse=True))
+    combined_pattern = re.compile(
+        rf'(?P<standard>(?<!\w)(?P<standard_month>{_MONTH_ALTERNATION})\s+(?P<standard_day>\d{{1,2}}),?\s+(?P<standard_year>\d{{4}}))'
+        r'|(?P<reverse>\A(?P<reverse_month>\d{1,2})/(?P<reverse_day>\d{1,2})/(?P<reverse_year>\d{4}))'  # MM/DD/YYYY
+        r'|(?P<short>\A(?P<short_day>\d{1,2})-(?P<short_month>\d{1,2})-(?P<short_year>\d{4}))'  # DD-MM-YYYY
+        rf'|(?P<space>(?P<space_day>\d{{1,2}})\s+(?P<space_month>{_MONTH_ALTERNATION})\s+(?P<space_year>\d{{4}}))'  # "20 June 2025"
+        r'|(?P<dot>\A(?P<dot_day>\d{1,2})\.(?P<dot_month>\d{1,2})\.(?P<dot_year>\d{4}))'  # "20.06.2025"
+    )
+    
+    def parse_date(self, date_input: str, today: Optional[date] = None) -> Tuple[bool, str, Optional[str]]:
         """
         Parse a date string into YYYY-MM-DD format.
         
         Args:
             date_input: Natural language date string
+            today: Reference date for relative expressions (defaults to date.today())
             
         Returns:
             Tuple of (success: bool, result: str, error_message: Optional[str])
@@ -44,151 +74,63 @@ class DateParser:
         if not date_input or not isinstance(date_input, str):
             return False, date_input or "", "Date input is required"
         
-        date_input = date_input.strip()
+        return _parse_date_cached(date_input.strip(), today or date.today())
+    
+    @staticmethod
+    def _parse_iso(value: str) -> Optional[date]:
+        """
+        Convert a strict YYYY-MM-DD string by slicing, without regex or strptime.
+        Returns None if the string is not in that shape; raises ValueError if it is not a real date.
+        """
+        if len(value) != 10 or value[4] != '-' or value[7] != '-':
+            return None
+        digits = value[:4] + value[5:7] + value[8:]
+        if not (digits.isascii() and digits.isdigit()):
+            return None
+        return date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+    
+    def parse_dates(self, date_inputs: List[str]) -> List[Tuple[bool, str, Optional[str]]]:
+        """
+        Parse several date strings against the same reference date.
         
-        try:
-            # 1. Check if already in YYYY-MM-DD format
-            if self.iso_pattern.match(date_input):
-                # Validate the date is actually valid
-                parsed_date = datetime.strptime(date_input, '%Y-%m-%d').date()
-                return True, date_input, None
-            
-            # 2. Handle relative dates
-            relative_result = self._parse_relative_date(date_input)
-            if relative_result:
-                return True, relative_result.strftime('%Y-%m-%d'), None
-            
-            # 3. Handle ordinal dates (20th June 2025, 1st January 2024)
-            ordinal_match = self.ordinal_pattern.search(date_input.lower())
-            if ordinal_match:
-                day = int(ordinal_match.group(1))
-                month_name = ordinal_match.group(3)
-                year = int(ordinal_match.group(4))
-                
-                month = self.MONTH_NAMES.get(month_name.lower())
-                if month:
-                    parsed_date = date(year, month, day)
-                    return True, parsed_date.strftime('%Y-%m-%d'), None
-            
-            # 4. Handle standard formats (June 20, 2025 or June 20 2025)
-            standard_match = self.standard_pattern.search(date_input.lower())
-            if standard_match:
-                month_name = standard_match.group(1)
-                day = int(standard_match.group(2))
-                year = int(standard_match.group(3))
-                
-                month = self.MONTH_NAMES.get(month_name.lower())
-                if month:
-                    parsed_date = date(year, month, day)
-                    return True, parsed_date.strftime('%Y-%m-%d'), None
-              # 5. Handle MM/DD/YYYY format (fix the logic)
-            reverse_match = self.reverse_pattern.match(date_input)
-            if reverse_match:
-                month = int(reverse_match.group(1))
-                day = int(reverse_match.group(2))
-                year = int(reverse_match.group(3))
-                
-                # Validate month and day ranges
-                if 1 <= month <= 12 and 1 <= day <= 31:
-                    parsed_date = date(year, month, day)
-                    return True, parsed_date.strftime('%Y-%m-%d'), None
-            
-            # 6. Handle DD-MM-YYYY format  
-            short_match = self.short_pattern.match(date_input)
-            if short_match:
-                day = int(short_match.group(1))
-                month = int(short_match.group(2))
-                year = int(short_match.group(3))
-                
-                # Validate ranges
-                if 1 <= month <= 12 and 1 <= day <= 31:
-                    parsed_date = date(year, month, day)
-                    return True, parsed_date.strftime('%Y-%m-%d'), None
-            
-            # 7. Handle "20 June 2025" format (space separated)
-            space_match = self.space_pattern.search(date_input.lower())
-            if space_match:
-                day = int(space_match.group(1))
-                month_name = space_match.group(2)
-                year = int(space_match.group(3))
-                
-                month = self.MONTH_NAMES.get(month_name.lower())
-                if month:
-                    parsed_date = date(year, month, day)
-                    return True, parsed_date.strftime('%Y-%m-%d'), None
-            
-            # 8. Handle DD.MM.YYYY format
-            dot_match = self.dot_pattern.match(date_input)
-            if dot_match:
-                day = int(dot_match.group(1))
-                month = int(dot_match.group(2))
-                year = int(dot_match.group(3))
-                
-                # Validate ranges
-                if 1 <= month <= 12 and 1 <= day <= 31:
-                    parsed_date = date(year, month, day)
-                    return True, parsed_date.strftime('%Y-%m-%d'), None
-            
-            # If none of the patterns match
-            return False, date_input, f"Could not parse date format: '{date_input}'. Supported formats: YYYY-MM-DD, '20th June 2025', 'June 20, 2025', 'next month', 'tomorrow', etc."
+        Args:
+            date_inputs: Natural language date strings
             
-        except ValueError as e:
-            return False, date_input, f"Invalid date: {str(e)}"
-        except Exception as e:
-            return False, date_input, f"Error parsing date: {str(e)}"
+        Returns:
+            List of parse_date results, in input order
+        """
+        today = date.today()
+        return [self.parse_date(date_input, today) for date_input in date_inputs]
     
-    def _parse_relative_date(self, date_input: str) -> Optional[date]:
+    def _parse_relative_date(self, date_input: str, today: Optional[date] = None) -> Optional[date]:
         """Parse relative date expressions like 'tomorrow', 'next month', etc."""
-        date_input = date_input.lower().strip()
-        today = date.today()
+        date_input = date_input.lower()
+        if today is None:
+            today = date.today()
         
-        if date_input in ['today']:
-            return today
-        elif date_input in ['tomorrow']:
-            return today + timedelta(days=1)
-        elif date_input in ['yesterday']:
-            return today - timedelta(days=1)
-        elif date_input in ['next week']:
-            return today + timedelta(weeks=1)
-        elif date_input in ['next month']:
-            # Go to first day of next month
-            if today.month == 12:
-                return date(today.year + 1, 1, 1)
-            else:
-                return date(today.year, today.month + 1, 1)
-        elif date_input in ['next year']:
-            return date(today.year + 1, today.month, today.day)
-        elif 'days' in date_input:
-            # Handle "in 30 days", "30 days from now"
-            days_match = re.search(r'(\d+)\s*days?', date_input)
-            if days_match:
-                days = int(days_match.group(1))
-                return today + timedelta(days=days)
-        elif 'weeks' in date_input:
-            # Handle "in 2 weeks", "2 weeks from now"
-            weeks_match = re.search(r'(\d+)\s*weeks?', date_input)
-            if weeks_match:
-                weeks = int(weeks_match.group(1))
-                return today + timedelta(weeks=weeks)
-        elif 'months' in date_input:
-            # Handle "in 3 months", "3 months from now"
-            months_match = re.search(r'(\d+)\s*months?', date_input)
-            if months_match:
-                months = int(months_match.group(1))
-                target_month = today.month + months
-                target_year = today.year
-                
-                while target_month > 12:
-                    target_month -= 12
-                    target_year += 1
-                
-                # Handle day overflow (e.g., Jan 31 + 1 month = Feb 28/29)
-                try:
-                    return date(target_year, target_month, today.day)
-                except ValueError:
-                    # Day doesn't exist in target month, use last day of month
-                    last_day = calendar.monthrange(target_year, target_month)[1]
-                    return date(target_year, target_month, last_day)
+        fixed = self.RELATIVE_DATES.get(date_input)
+        if fixed is not None:
+            return fixed(today)
+        elif 'days' in date_input or 'weeks' in date_input or 'months' in date_input:
+            # Handle "in 30 days", "2 weeks from now", "in 3 months"
+            offset_match = self.RELATIVE_OFFSET_PATTERN.search(date_input)
+            if not offset_match:
+                return None
+            count = int(offset_match.group('count'))
+            unit = offset_match.group('unit')
+            if unit == 'day':
+                return today + timedelta(days=count)
+            if unit == 'week':
+                return today + timedelta(weeks=count)
+            
+            target_year, target_month = _shift_month(today.year, today.month, count)
+            
+            # Handle day overflow (e.g., Jan 31 + 1 month = Feb 28/29)
+            try:
+                return date(target_year, target_month, today.day)
+            except ValueError:
+                # Day doesn't exist in target month, use last day of month
+                return date(*_shift_month(target_year, target_month, 1), 1) - timedelta(days=1)
         
         return None
     
@@ -204,15 +146,15 @@ class DateParser:
             Tuple of (is_valid: bool, message: str)
         """
         try:
-            parsed_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-            today = date.today()
+            parsed_date = self._parse_iso(date_str) or datetime.strptime(date_str, '%Y-%m-%d').date()
+            parsed_day = parsed_date.toordinal()
+            today = date.today().toordinal()
             
-            if not allow_past and parsed_date <= today:
+            if not allow_past and parsed_day <= today:
                 return False, f"Date {date_str} must be in the future"
             
             # Check if date is too far in the future (e.g., more than 2 years)
-            max_future = today + timedelta(days=730)  # 2 years
-            if parsed_date > max_future:
+            if parsed_day > today + self.MAX_FUTURE_DAYS:
                 return False, f"Date {date_str} is too far in the future (max 2 years from today)"
             
             return True, "Valid date"
@@ -221,6 +163,70 @@ class DateParser:
             return False, f"Invalid date format: {date_str}"
 
 
+# Shared parser for the convenience functions; it holds no per-call state
+_DEFAULT_PARSER = DateParser()
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_input: str, today: date) -> Tuple[bool, str, Optional[str]]:
+    """
+    Parse a stripped date string; keyed on the reference date so relative results expire daily.
+    Parsing holds no per-instance state, so one module-level cache serves every DateParser.
+    """
+    # The name-based patterns all match against the lowercased input
+    lowered = date_input.lower()
+    
+    try:
+        # 1. Check if already in YYYY-MM-DD format
+        # The string is already in the output format once it is a valid date
+        if DateParser._parse_iso(date_input):
+            return True, date_input, None
+        
+        # 2. Handle relative dates
+        relative_result = _DEFAULT_PARSER._parse_relative_date(lowered, today)
+        if relative_result:
+            return True, relative_result.strftime('%Y-%m-%d'), None
+        
+        # 3. Fixed-width MM/DD/YYYY, DD-MM-YYYY and DD.MM.YYYY are sliced directly
+        if len(date_input) == 10 and date_input[2] in DateParser.NUMERIC_SEPARATORS and date_input[5] == date_input[2]:
+            digits = date_input[:2] + date_input[3:5] + date_input[6:]
+            if digits.isdecimal():
+                first, second, year = int(digits[:2]), int(digits[2:4]), int(digits[4:])
+                month, day = (first, second) if date_input[2] == '/' else (second, first)
+                if 1 <= month <= 12 and 1 <= day <= 31:
+                    parsed_date = date(year, month, day)
+                    return True, parsed_date.strftime('%Y-%m-%d'), None
+        
+        # 4. Handle the remaining formats with a single search and dispatch on the branch that matched
+        match = DateParser.combined_pattern.search(DateParser.ORDINAL_SUFFIX_PATTERN.sub(r'\1', lowered))
+        if match:
+            kind = match.lastgroup
+            if kind in ('standard', 'space'):
+                # Standard (June 20, 2025) and space separated (20 June 2025 or 20th June 2025)
+                day = int(match.group(kind + '_day'))
+                # The pattern only accepts known month names, whose first three letters are their abbreviation
+                month = DateParser.MONTH_NAMES[match.group(kind + '_month')[:3]]
+                year = int(match.group(kind + '_year'))
+                parsed_date = date(year, month, day)
+                return True, parsed_date.strftime('%Y-%m-%d'), None
+            
+            # MM/DD/YYYY, DD-MM-YYYY and DD.MM.YYYY
+            day = int(match.group(kind + '_day'))
+            month = int(match.group(kind + '_month'))
+            year = int(match.group(kind + '_year'))
+            
+            # Validate ranges
+            if 1 <= month <= 12 and 1 <= day <= 31:
+                parsed_date = date(year, month, day)
+                return True, parsed_date.strftime('%Y-%m-%d'), None
+        
+        # If none of the patterns match
+        return False, date_input, f"Could not parse date format: '{date_input}'. Supported formats: YYYY-MM-DD, '20th June 2025', 'June 20, 2025', 'next month', 'tomorrow', etc."
+        
+    except ValueError as e:
+        return False, date_input, f"Invalid date: {str(e)}"
+    except Exception as e:
+        return False, date_input, f"Error parsing date: {str(e)}"
+
 # Convenience function for easy import
 def parse_natural_date(date_input: str) -> Tuple[bool, str, Optional[str]]:
     """
@@ -232,8 +238,7 @@ def parse_natural_date(date_input: str) -> Tuple[bool, str, Optional[str]]:
     Returns:
         Tuple of (success: bool, result: str, error_message: Optional[str])
     """
-    parser = DateParser()
-    return parser.parse_date(date_input)
+    return _DEFAULT_PARSER.parse_date(date_input)
 
 def validate_future_date(date_str: str, allow_past: bool = False) -> Tuple[bool, str]:
     """
@@ -246,8 +251,7 @@ def validate_future_date(date_str: str, allow_past: bool = False) -> Tuple[bool,
     Returns:
         Tuple of (is_valid: bool, message: str)
     """
-    parser = DateParser()
-    return parser.validate_future_date(date_str, allow_past)
+    return _DEFAULT_PARSER.validate_future_date(date_str, allow_past)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -6,13 +6,25 @@ Creates a webhook in JIRA to monitor CST project for issue updates
 
 import requests
 import json
+import logging
+from requests.adapters import HTTPAdapter
 import os
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
+# Serialize request bodies with orjson when it is installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 # Load environment variables from .env file
 load_dotenv('../env/.env.local.user')
 
+logger = logging.getLogger(__name__)
+
 class JiraWebhookManager:
     """Manages JIRA webhook creation and configuration"""
     
@@ -35,10 +47,16 @@ class JiraWebhookManager:
             'Accept': 'application/json'
         }
         
-        print(f"🔧 Initialized JIRA Webhook Manager")
-        print(f"📧 Email: {self.email}")
-        print(f"🌐 JIRA URL: {self.jira_url}")
-        print(f"🔑 API Token: {'*' * 20}...{self.api_token[-10:]}")
+        # One keep-alive session so list/create/update/delete reuse the HTTPS connection
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        
+        logger.info("Initialized JIRA Webhook Manager")
+        logger.info("Email: %s", self.email)
+        logger.info("JIRA URL: %s", self.jira_url)
+        logger.debug("API Token: %s...%s", '*' * 20, self.api_token[-10:])
     
     def create_webhook(self, ngrok_url: str) -> Dict[str, Any]:
         """Create a new JIRA webhook"""
@@ -58,100 +76,86 @@ class JiraWebhookManager:
             # Note: No secret field - removes the secret requirement
         }
         
-        print(f"\n📡 Creating webhook with configuration:")
-        print(json.dumps(webhook_config, indent=2))
+        logger.info("Creating webhook for %s", webhook_config["url"])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Webhook configuration:\n%s", json.dumps(webhook_config, indent=2))
         
         try:
-            response = requests.post(
-                self.webhook_endpoint,
-                auth=self.auth,
-                headers=self.headers,
-                data=json.dumps(webhook_config)
-            )
+            response = self.session.post(self.webhook_endpoint, data=_dumps(webhook_config))
             
-            print(f"\n📊 Response Status: {response.status_code}")
+            logger.info("Response Status: %s", response.status_code)
             
             if response.status_code == 201:
                 webhook_data = response.json()
-                print(f"✅ Webhook created successfully!")
-                print(f"🆔 Webhook ID: {webhook_data.get('self', '').split('/')[-1]}")
-                print(f"🌐 Webhook URL: {webhook_data.get('url')}")
-                print(f"📋 Events: {webhook_data.get('events')}")
-                print(f"🟢 Enabled: {webhook_data.get('enabled')}")
-                print(f"🔐 Is Signed: {webhook_data.get('isSigned', False)}")
+                logger.info("Webhook created successfully")
+                logger.info("Webhook ID: %s", webhook_data.get('self', '').split('/')[-1])
+                logger.info("Webhook URL: %s", webhook_data.get('url'))
+                logger.info("Events: %s", webhook_data.get('events'))
+                logger.info("Enabled: %s", webhook_data.get('enabled'))
+                logger.info("Is Signed: %s", webhook_data.get('isSigned', False))
                 return webhook_data
             else:
-                print(f"❌ Failed to create webhook. Status: {response.status_code}")
-                print(f"📝 Response: {response.text}")
+                logger.error("Failed to create webhook. Status: %s", response.status_code)
+                logger.error("Response: %s", response.text)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error creating webhook: {e}")
+            logger.error("Error creating webhook: %s", e)
             return None
     
     def list_webhooks(self) -> Optional[list]:
         """List all existing webhooks"""
         try:
-            print(f"\n📋 Fetching webhooks from: {self.webhook_endpoint}")
+            logger.info("Fetching webhooks from: %s", self.webhook_endpoint)
             
-            response = requests.get(
-                self.webhook_endpoint,
-                auth=self.auth,
-                headers=self.headers
-            )
+            response = self.session.get(self.webhook_endpoint)
             
-            print(f"📊 Response Status: {response.status_code}")
+            logger.info("Response Status: %s", response.status_code)
             
             if response.status_code == 200:
                 webhooks = response.json()
-                print(f"\n🔍 Found {len(webhooks)} existing webhooks:")
-                print("=" * 60)
+                logger.info("Found %d existing webhooks", len(webhooks))
                 
                 for i, webhook in enumerate(webhooks, 1):
-                    webhook_id = webhook.get('self', '').split('/')[-1]
-                    print(f"\n{i}. {webhook.get('name')}")
-                    print(f"   🆔 ID: {webhook_id}")
-                    print(f"   🌐 URL: {webhook.get('url')}")
-                    print(f"   📋 Events: {', '.join(webhook.get('events', []))}")
-                    print(f"   🟢 Enabled: {webhook.get('enabled')}")
-                    print(f"   🔐 Is Signed: {webhook.get('isSigned', False)}")
+                    logger.info("%d. %s", i, webhook.get('name'))
+                    logger.info("   ID: %s", webhook.get('self', '').split('/')[-1])
+                    logger.info("   URL: %s", webhook.get('url'))
+                    logger.info("   Events: %s", ', '.join(webhook.get('events', [])))
+                    logger.info("   Enabled: %s", webhook.get('enabled'))
+                    logger.info("   Is Signed: %s", webhook.get('isSigned', False))
                     if webhook.get('filters'):
-                        print(f"   🔍 Filters: {webhook.get('filters')}")
+                        logger.info("   Filters: %s", webhook.get('filters'))
                 
                 return webhooks
             else:
-                print(f"❌ Failed to list webhooks. Status: {response.status_code}")
-                print(f"📝 Response: {response.text}")
+                logger.error("Failed to list webhooks. Status: %s", response.status_code)
+                logger.error("Response: %s", response.text)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error listing webhooks: {e}")
+            logger.error("Error listing webhooks: %s", e)
             return None
     
     def delete_webhook(self, webhook_id: str) -> bool:
         """Delete a specific webhook"""
         try:
             delete_url = f"{self.webhook_endpoint}/{webhook_id}"
-            print(f"\n🗑️ Deleting webhook: {delete_url}")
+            logger.info("Deleting webhook: %s", delete_url)
             
-            response = requests.delete(
-                delete_url,
-                auth=self.auth,
-                headers=self.headers
-            )
+            response = self.session.delete(delete_url)
             
-            print(f"📊 Response Status: {response.status_code}")
+            logger.info("Response Status: %s", response.status_code)
             
             if response.status_code == 204:
-                print(f"✅ Webhook {webhook_id} deleted successfully!")
+                logger.info("Webhook %s deleted successfully", webhook_id)
                 return True
             else:
-                print(f"❌ Failed to delete webhook {webhook_id}. Status: {response.status_code}")
-                print(f"📝 Response: {response.text}")
+                logger.error("Failed to delete webhook %s. Status: %s", webhook_id, response.status_code)
+                logger.error("Response: %s", response.text)
                 return False
                 
         except Exception as e:
-            print(f"❌ Error deleting webhook {webhook_id}: {e}")
+            logger.error("Error deleting webhook %s: %s", webhook_id, e)
             return False
     
     def update_webhook(self, webhook_id: str, ngrok_url: str) -> Dict[str, Any]:
@@ -173,32 +177,27 @@ class JiraWebhookManager:
         
         try:
             update_url = f"{self.webhook_endpoint}/{webhook_id}"
-            print(f"\n🔄 Updating webhook: {update_url}")
-            print(f"📡 New configuration:")
-            print(json.dumps(webhook_config, indent=2))
+            logger.info("Updating webhook: %s", update_url)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("New configuration:\n%s", json.dumps(webhook_config, indent=2))
             
-            response = requests.put(
-                update_url,
-                auth=self.auth,
-                headers=self.headers,
-                data=json.dumps(webhook_config)
-            )
+            response = self.session.put(update_url, data=_dumps(webhook_config))
             
-            print(f"📊 Response Status: {response.status_code}")
+            logger.info("Response Status: %s", response.status_code)
             
             if response.status_code == 200:
                 webhook_data = response.json()
-                print(f"✅ Webhook {webhook_id} updated successfully!")
-                print(f"🌐 New URL: {webhook_data.get('url')}")
-                print(f"🟢 Enabled: {webhook_data.get('enabled')}")
+                logger.info("Webhook %s updated successfully", webhook_id)
+                logger.info("New URL: %s", webhook_data.get('url'))
+                logger.info("Enabled: %s", webhook_data.get('enabled'))
                 return webhook_data
             else:
-                print(f"❌ Failed to update webhook {webhook_id}. Status: {response.status_code}")
-                print(f"📝 Response: {response.text}")
+                logger.error("Failed to update webhook %s. Status: %s", webhook_id, response.status_code)
+                logger.error("Response: %s", response.text)
                 return None
                 
         except Exception as e:
-            print(f"❌ Error updating webhook {webhook_id}: {e}")
+            logger.error("Error updating webhook %s: %s", webhook_id, e)
             return None
 
 def main():
@@ -207,6 +206,9 @@ def main():
     # Your ngrok URL
     NGROK_URL = "https://e0bd-49-207-245-139.ngrok-free.app"
     
+    # Progress and results from the manager are reported through logging
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
     print("🔧 JIRA Webhook Manager for MontyCloud")
     print("=" * 50)
     
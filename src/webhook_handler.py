@@ -529,24 +529,154 @@ Handles incoming webhook events from JIRA when ticket status changes
 """
 
 import os
+import re
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from types import MappingProxyType
 from typing import Dict, Any, Optional
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request
 from datetime import datetime
 
+# Decode webhook bodies and encode replies with orjson when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
  # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Display titles for each supported action type
+_ACTION_TITLES = MappingProxyType({
+    'approve_signup': 'Customer Signup Approval',
+    'extend_trial': 'Trial Extension',
+    'enable_beta_features': 'Beta Features Enablement',
+    'upgrade_subscription': 'Subscription Upgrade'
+})
+_DEFAULT_ACTION_TITLE = 'Customer Request'
+
+# Lower-cased JIRA statuses grouped by the notification they trigger
+_APPROVAL_STATES = frozenset({'approved', 'done', 'completed'})
+_REJECTION_STATES = frozenset({'rejected', 'denied', 'cancelled'})
+_EXECUTE_STATES = frozenset({'approved', 'done'})  # Statuses that run the approved task
+
+# Message generator for each status bucket; anything else gets a plain status update
+_MESSAGE_GENERATORS = MappingProxyType({
+    **dict.fromkeys(_APPROVAL_STATES, 'generate_approval_message'),
+    **dict.fromkeys(_REJECTION_STATES, 'generate_rejection_message')
+})
+
+# Pre-encoded bodies for the fixed webhook replies, so they skip the JSON encoder
+_EMPTY_PAYLOAD_BODY = b'{"error":"Empty payload"}'
+_IGNORED_BODY = b'{"status":"ignored"}'
+_NO_STATUS_CHANGE_BODY = b'{"status":"no_status_change"}'
+
+# Action labels on a ticket and the action type each maps to
+_ACTION_LABELS = MappingProxyType({
+    'customer-onboarding': 'customer_onboarding',
+    'trial-extension': 'trial_extension',
+    'feature-enablement': 'feature_enablement',
+    'subscription-upgrade': 'subscription_upgrade'
+})
+
+# Summary phrases checked in order when no action label is present
+_SUMMARY_KEYWORDS = (
+    ('trial extension', 'extend_trial'),
+    ('signup approval', 'approve_signup'),
+    ('beta features', 'enable_beta_features'),
+    ('subscription upgrade', 'upgrade_subscription')
+)
+
+# Customer email in the description: the first line that is either a "Customer Email: ..." style
+# entry or has no ':' anywhere and contains an address; only the address itself is captured
+_EMAIL_ADDRESS = r'\b[\w.+-]+@[\w-]+\.[\w.-]+\b'
+_EMAIL_LINE_RE = re.compile(
+    rf'^[^\S\n]*(?:customer[ _]email|email)[^\S\n]*:[^\n]*?({_EMAIL_ADDRESS})'
+    rf'|^[^:\n]*?({_EMAIL_ADDRESS})[^:\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Task parameter keys accepted in ticket descriptions and the parameter each one sets
+_TASK_PARAM_ALIASES = MappingProxyType({
+    **dict.fromkeys(('company_name', 'company', 'organization'), 'company_name'),
+    **dict.fromkeys(('end_date', 'trial_end_date', 'new_end_date'), 'end_date'),
+    **dict.fromkeys(('features', 'beta_features', 'requested_features'), 'features'),
+    **dict.fromkeys(('subscription_type', 'new_plan', 'target_plan'), 'subscription_type'),
+    **dict.fromkeys(('current_plan', 'current_subscription'), 'current_plan')
+})
+# "Key: value" description lines for any of the keys above, written with spaces or underscores.
+# [^\S\n] is any whitespace but a line break, so lines are trimmed like str.strip() (including CRLF's \r)
+_TASK_PARAM_RE = re.compile(
+    r'^[^\S\n]*(' + '|'.join(key.replace('_', '[ _]') for key in sorted(_TASK_PARAM_ALIASES, key=len, reverse=True))
+    + r')[^\S\n]*:[^\S\n]*(.*?)[^\S\n]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Teams message templates, filled in with str.format
+_APPROVAL_TEMPLATE = """🎉 **GREAT! REQUEST APPROVED**
+
+✅ **Ticket**: {ticket_key}
+📧 **Customer**: {customer_email}
+📋 **Request**: {action_title}
+🔗 **JIRA Link**: {ticket_url}
+
+{execution_result}"""
+
+_REJECTION_TEMPLATE = """❌ **REQUEST REJECTED**
+
+🎫 **Ticket**: {ticket_key}
+📧 **Customer**: {customer_email}
+📋 **Request**: {action_title}
+🔗 **JIRA Link**: {ticket_url}
+
+The request for {action_title_lower} has been **REJECTED**.
+
+**Comments from JIRA**: 
+{rejection_comments}
+
+Status: Request denied"""
+
+_STATUS_UPDATE_TEMPLATE = """📊 **STATUS UPDATE**
+
+🎫 **Ticket**: {ticket_key}
+📧 **Customer**: {customer_email}
+📋 **Request**: {action_title}
+🔄 **New Status**: {status}
+🔗 **JIRA Link**: {ticket_url}
+
+The ticket status has been updated to: **{status}**"""
+
+def _json_response(obj: Dict[str, Any], status: int = 200) -> Response:
+    """Build a JSON reply without going through Flask's stdlib-based jsonify"""
+    return Response(_dumps(obj), status, mimetype='application/json')
+
 class JiraWebhookHandler:
     """Handles JIRA webhook events for ticket status changes"""
     
     def __init__(self):
         """Initialize webhook handler"""
         self.app = Flask(__name__)
+        # Status changes are handled off the request thread so JIRA gets its response straight away;
+        # a single worker keeps notifications for the same ticket in the order they arrived
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='jira-webhook')
         self.setup_routes()
     
+    @cached_property
+    def jira(self):
+        """JIRA client, created on first use and reused across webhooks"""
+        # Import here to avoid circular imports
+        from jira_integration import JiraIntegration
+        
+        return JiraIntegration()
+    
     def setup_routes(self):
         """Setup Flask routes for webhook endpoints"""
         @self.app.route('/webhook/jira', methods=['POST'])
@@ -555,21 +685,19 @@ class JiraWebhookHandler:
         
         @self.app.route('/webhook/health', methods=['GET'])
         def health_check():
-            return jsonify({"status": "healthy", "timestamp": datetime.now().isoformat()})
+            return _json_response({"status": "healthy", "timestamp": datetime.now().isoformat()})
     
     def process_jira_webhook(self) -> tuple:
         """Process incoming JIRA webhook events"""
         try:
-            print("hellooo")
-            # Get the webhook payload
-            data = request.get_json()
-            print("hellooo1")
+            # Get the webhook payload straight from the raw body
+            raw = request.get_data(cache=False)
+            data = _loads(raw) if raw else None
             if not data:
                 logger.warning("Received empty webhook payload")
-                return jsonify({"error": "Empty payload"}), 400
+                return Response(_EMPTY_PAYLOAD_BODY, 400, mimetype='application/json')
               # Log the webhook event
             logger.info(f"Received JIRA webhook: {data.get('webhookEvent', 'unknown')}")
-            print("hellooo2")
             # Check if this is an issue update event
             webhook_event = data.get('webhookEvent')
             
@@ -577,44 +705,45 @@ class JiraWebhookHandler:
             # This handles Jira's various webhook formats
             if not webhook_event or (webhook_event != 'jira:issue_updated' and 'changelog' not in data):
                 logger.info(f"Ignoring webhook event: {webhook_event}")
-                return jsonify({"status": "ignored"}), 200
+                return Response(_IGNORED_BODY, 200, mimetype='application/json')
             
             # Extract issue information
             issue_info = self.extract_issue_info(data)
-            print("hellooo3")
             if not issue_info:
                 logger.warning("Could not extract issue information from webhook")
-                return jsonify({"error": "Invalid issue data"}), 400
+                return _json_response({"error": "Invalid issue data"}, 400)
             
             # Check if status changed
             status_change = self.extract_status_change(data)
-            print("hellooo4")
             if not status_change:
                 logger.info("No status change detected, ignoring")
-                return jsonify({"status": "no_status_change"}), 200
+                return Response(_NO_STATUS_CHANGE_BODY, 200, mimetype='application/json')
             
-            # Process the status change
-            self.handle_status_change(issue_info, status_change)
+            # Process the status change in the background
+            self._executor.submit(self.handle_status_change, issue_info, status_change)
             
-            return jsonify({"status": "processed"}), 200
+            return _json_response({"status": "processed"})
             
         except Exception as e:
             logger.error(f"Error processing JIRA webhook: {e}")
-            return jsonify({"error": "Processing failed"}), 500
+            return _json_response({"error": "Processing failed"}, 500)
     
     def extract_issue_info(self, data: Dict[str, Any]) -> Optional[Dict[str, str]]:
         """Extract relevant issue information from webhook data"""
         try:
-            issue = data.get('issue', {})
+            # JIRA sends null for unset objects, so fall back on falsy values rather than missing keys
+            issue = data.get('issue') or {}
+            fields = issue.get('fields') or {}
+            key = issue.get('key', '')
             
             return {
-                "key": issue.get('key', ''),
-                "summary": issue.get('fields', {}).get('summary', ''),
-                "description": self.extract_description(issue.get('fields', {}).get('description', {})),
-                "assignee": issue.get('fields', {}).get('assignee', {}).get('emailAddress', ''),
+                "key": key,
+                "summary": fields.get('summary', ''),
+                "description": self.extract_description(fields.get('description')),
+                "assignee": (fields.get('assignee') or {}).get('emailAddress', ''),
                 "customer_email": self.extract_customer_email(issue),
                 "action_type": self.extract_action_type(issue),
-                "url": f"https://montycloud.atlassian.net/browse/{issue.get('key', '')}"
+                "url": f"https://montycloud.atlassian.net/browse/{key}"
             }
         except Exception as e:
             logger.error(f"Error extracting issue info: {e}")
@@ -623,18 +752,18 @@ class JiraWebhookHandler:
     def extract_status_change(self, data: Dict[str, Any]) -> Optional[Dict[str, str]]:
         """Extract status change information from webhook data"""
         try:
-            changelog = data.get('changelog', {})
-            items = changelog.get('items', [])
-            
-            for item in items:
-                if item.get('field') == 'status':
-                    return {
-                        "from_status": item.get('fromString', ''),
-                        "to_status": item.get('toString', ''),
-                        "changed_by": data.get('user', {}).get('emailAddress', ''),
-                        "timestamp": changelog.get('created', '')
-                    }
-            return None
+            changelog = data.get('changelog') or {}
+            
+            # The first status item describes the transition
+            item = next((item for item in changelog.get('items') or [] if item.get('field') == 'status'), None)
+            if item is None:
+                return None
+            return {
+                "from_status": item.get('fromString', ''),
+                "to_status": item.get('toString', ''),
+                "changed_by": (data.get('user') or {}).get('emailAddress', ''),
+                "timestamp": changelog.get('created', '')
+            }
         except Exception as e:
             logger.error(f"Error extracting status change: {e}")
             return None
@@ -643,15 +772,13 @@ class JiraWebhookHandler:
         """Extract plain text from JIRA description object"""
         try:
             if isinstance(description_obj, dict):
-                content = description_obj.get('content', [])
-                text_parts = []
-                for part in content:
-                    if part.get('type') == 'paragraph':
-                        for content_item in part.get('content', []):
-                            if content_item.get('type') == 'text':
-                                text_parts.append(content_item.get('text', ''))
-                return '\n'.join(text_parts)
-            return str(description_obj)        
+                # Text nodes of each top-level paragraph, one per line
+                return '\n'.join(
+                    content_item.get('text', '')
+                    for part in description_obj.get('content', []) if part.get('type') == 'paragraph'
+                    for content_item in part.get('content', []) if content_item.get('type') == 'text'
+                )
+            return str(description_obj) if description_obj is not None else ''
         except Exception:
             return ''
     
@@ -659,7 +786,8 @@ class JiraWebhookHandler:
         """Extract customer email from issue summary or description"""
         try:
             # First check summary (format: "Action - email@domain.com")
-            summary = issue.get('fields', {}).get('summary', '')
+            fields = issue.get('fields') or {}
+            summary = fields.get('summary') or ''
             if ' - ' in summary:
                 parts = summary.split(' - ')
                 if len(parts) > 1:
@@ -668,75 +796,42 @@ class JiraWebhookHandler:
                         return potential_email
             
             # Then check description for patterns like "Customer Email: email@domain.com"
-            description = self.extract_description(issue.get('fields', {}).get('description', {}))
-            if description:
-                lines = description.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    # Look for patterns like "Customer Email:", "Email:", etc.
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        key = key.strip().lower()
-                        value = value.strip()
-                        
-                        if key in ['customer email', 'email', 'customer_email'] and '@' in value:
-                            return value
-                    
-                    # Also look for standalone email addresses in the description
-                    elif '@' in line and '.' in line.split('@')[1]:
-                        # Simple email validation
-                        words = line.split()
-                        for word in words:
-                            if '@' in word and '.' in word.split('@')[1]:
-                                return word.strip()
-            
-            return ''
+            description = self.extract_description(fields.get('description'))
+            match = _EMAIL_LINE_RE.search(description)
+            return match.group(match.lastindex) if match else ''
         except Exception:
             return ''
     
     def extract_action_type(self, issue: Dict[str, Any]) -> str:
         """Extract the action type from issue labels or summary"""
         try:
-            labels = issue.get('fields', {}).get('labels', [])
-            action_labels = [
-                'customer-onboarding', 'trial-extension', 
-                'feature-enablement', 'subscription-upgrade'
-            ]
+            fields = issue.get('fields') or {}
             
-            for label in labels:
-                if label in action_labels:
-                    return label.replace('-', '_')
+            for label in fields.get('labels') or []:
+                action_type = _ACTION_LABELS.get(label)
+                if action_type:
+                    return action_type
             
             # Fallback: extract from summary
-            summary = issue.get('fields', {}).get('summary', '').lower()
-            if 'trial extension' in summary:
-                return 'extend_trial'
-            elif 'signup approval' in summary:
-                return 'approve_signup'
-            elif 'beta features' in summary:
-                return 'enable_beta_features'
-            elif 'subscription upgrade' in summary:
-                return 'upgrade_subscription'
-            
-            return 'unknown'
+            summary = (fields.get('summary') or '').lower()
+            return next((action_type for keyword, action_type in _SUMMARY_KEYWORDS if keyword in summary), 'unknown')
         except Exception:
             return 'unknown'
     
     def handle_status_change(self, issue_info: Dict[str, str], status_change: Dict[str, str]):
         """Handle the status change and notify Teams"""
         try:
-            ticket_key = issue_info['key']
-            customer_email = issue_info['customer_email']
-            action_type = issue_info['action_type']
-            new_status = status_change['to_status'].lower()
-            ticket_url = issue_info['url']
+            ticket_key, customer_email, action_type, ticket_url = (
+                issue_info.get(k, '') for k in ('key', 'customer_email', 'action_type', 'url')
+            )
+            from_status, to_status = status_change['from_status'], status_change['to_status']
+            new_status = to_status.casefold()
             
-            logger.info(f"Processing status change for {ticket_key}: {status_change['from_status']} -> {status_change['to_status']}")
+            logger.info(f"Processing status change for {ticket_key}: {from_status} -> {to_status}")
               # Generate appropriate message based on status
-            if new_status in ['approved', 'done', 'completed']:
-                message = self.generate_approval_message(ticket_key, customer_email, action_type, ticket_url, issue_info)
-            elif new_status in ['rejected', 'denied', 'cancelled']:
-                message = self.generate_rejection_message(ticket_key, customer_email, action_type, ticket_url, issue_info)
+            generator = _MESSAGE_GENERATORS.get(new_status)
+            if generator:
+                message = getattr(self, generator)(ticket_key, customer_email, action_type, ticket_url, issue_info)
             else:
                 message = self.generate_status_update_message(ticket_key, customer_email, action_type, new_status, ticket_url)
             
@@ -744,7 +839,7 @@ class JiraWebhookHandler:
             self.send_teams_notification(message, issue_info, status_change)
             
             # Execute the approved task if applicable
-            if new_status in ['approved', 'done']:
+            if new_status in _EXECUTE_STATES:
                 task_result = self.execute_approved_task(issue_info)
                 logger.info(f"Task execution result for {ticket_key}: {task_result}")
             
@@ -752,14 +847,7 @@ class JiraWebhookHandler:
             logger.error(f"Error handling status change: {e}")
     def generate_approval_message(self, ticket_key: str, customer_email: str, action_type: str, ticket_url: str, issue_info: Dict[str, str] = None) -> str:
         """Generate approval message for Teams and execute the approved task"""
-        action_titles = {
-            'approve_signup': 'Customer Signup Approval',
-            'extend_trial': 'Trial Extension',
-            'enable_beta_features': 'Beta Features Enablement',
-            'upgrade_subscription': 'Subscription Upgrade'
-        }
-        
-        action_title = action_titles.get(action_type, 'Customer Request')
+        action_title = _ACTION_TITLES.get(action_type, _DEFAULT_ACTION_TITLE)
         
         # Execute the approved task
         if issue_info:
@@ -767,88 +855,62 @@ class JiraWebhookHandler:
         else:
             execution_result = f"✅ Task execution initiated for {action_title.lower()}"
         
-        return f"""🎉 **GREAT! REQUEST APPROVED**
-
-✅ **Ticket**: {ticket_key}
-📧 **Customer**: {customer_email}
-📋 **Request**: {action_title}
-🔗 **JIRA Link**: {ticket_url}
-
-{execution_result}"""
+        return _APPROVAL_TEMPLATE.format(
+            ticket_key=ticket_key,
+            customer_email=customer_email,
+            action_title=action_title,
+            ticket_url=ticket_url,
+            execution_result=execution_result
+        )
     def generate_rejection_message(self, ticket_key: str, customer_email: str, action_type: str, ticket_url: str, issue_info: Dict[str, str]) -> str:
         """Generate rejection message for Teams"""
-        action_titles = {
-            'approve_signup': 'Customer Signup Approval',
-            'extend_trial': 'Trial Extension',
-            'enable_beta_features': 'Beta Features Enablement',
-            'upgrade_subscription': 'Subscription Upgrade'
-        }
-        
-        action_title = action_titles.get(action_type, 'Customer Request')
+        action_title = _ACTION_TITLES.get(action_type, _DEFAULT_ACTION_TITLE)
         
         # Get JIRA comments for the rejection reason
         rejection_comments = self.get_rejection_comments(ticket_key)
         
-        return f"""❌ **REQUEST REJECTED**
-
-🎫 **Ticket**: {ticket_key}
-📧 **Customer**: {customer_email}
-📋 **Request**: {action_title}
-🔗 **JIRA Link**: {ticket_url}
-
-The request for {action_title.lower()} has been **REJECTED**.
-
-**Comments from JIRA**: 
-{rejection_comments}
-
-Status: Request denied"""
+        return _REJECTION_TEMPLATE.format(
+            ticket_key=ticket_key,
+            customer_email=customer_email,
+            action_title=action_title,
+            action_title_lower=action_title.lower(),
+            ticket_url=ticket_url,
+            rejection_comments=rejection_comments
+        )
     
     def generate_status_update_message(self, ticket_key: str, customer_email: str, action_type: str, status: str, ticket_url: str) -> str:
         """Generate general status update message"""
-        action_titles = {
-            'approve_signup': 'Customer Signup Approval',
-            'extend_trial': 'Trial Extension', 
-            'enable_beta_features': 'Beta Features Enablement',
-            'upgrade_subscription': 'Subscription Upgrade'
-        }
-        
-        action_title = action_titles.get(action_type, 'Customer Request')
-        
-        return f"""📊 **STATUS UPDATE**
-
-🎫 **Ticket**: {ticket_key}
-📧 **Customer**: {customer_email}
-📋 **Request**: {action_title}
-🔄 **New Status**: {status.title()}
-🔗 **JIRA Link**: {ticket_url}
-
-The ticket status has been updated to: **{status.title()}**"""
+        return _STATUS_UPDATE_TEMPLATE.format(
+            ticket_key=ticket_key,
+            customer_email=customer_email,
+            action_title=_ACTION_TITLES.get(action_type, _DEFAULT_ACTION_TITLE),
+            status=status.title(),
+            ticket_url=ticket_url
+        )
     
     def get_rejection_comments(self, ticket_key: str) -> str:
         """Get comments from JIRA ticket for rejection notifications"""
         try:
-            # Import here to avoid circular imports
-            from jira_integration import JiraIntegration
-            
-            jira = JiraIntegration()
-            return jira.get_ticket_comments(ticket_key)
+            return self.jira.get_ticket_comments(ticket_key)
         except Exception as e:
             logger.error(f"Error getting JIRA comments: {e}")
             return "Please check the JIRA ticket for detailed comments and reasoning."
     
     def send_teams_notification(self, message: str, issue_info: Dict[str, str], status_change: Dict[str, str]):
         """Send notification to Teams"""
-        # For simplicity, we'll just output to console directly first
-        print("\n" + "=" * 80)
-        print("🔔 JIRA STATUS CHANGE NOTIFICATION:")
-        print("=" * 80)
-        print(message)
-        print(f"\n📋 Details:")
-        print(f"   Ticket: {issue_info.get('key', 'N/A')}")
-        print(f"   Status: {status_change.get('from_status', 'N/A')} → {status_change.get('to_status', 'N/A')}")            
-        print(f"   Customer: {issue_info.get('customer_email', 'N/A')}")
-        print(f"   Action: {issue_info.get('action_type', 'N/A')}")
-        print("=" * 80)
+        # For simplicity, we'll just output to console directly first, as one write
+        print("\n".join((
+            "\n" + "=" * 80,
+            "🔔 JIRA STATUS CHANGE NOTIFICATION:",
+            "=" * 80,
+            message,
+            "\n📋 Details:",
+            f"   Ticket: {issue_info.get('key', 'N/A')}",
+            f"   Status: {status_change.get('from_status', 'N/A')} → {status_change.get('to_status', 'N/A')}",
+            f"   Customer: {issue_info.get('customer_email', 'N/A')}",
+            f"   Action: {issue_info.get('action_type', 'N/A')}",
+            "=" * 80
+        )))
         logger.info(f"Status change notification for ticket {issue_info.get('key', '')}: {status_change.get('from_status', '')} → {status_change.get('to_status', '')}")
     
     def run(self, host='0.0.0.0', port=5000, debug=False):
@@ -889,26 +951,15 @@ The ticket status has been updated to: **{status.title()}**"""
             description = issue_info.get('description', '')
             params = {}
             
-            # Parse common patterns from description
-            lines = description.split('\n')
-            for line in lines:
-                line = line.strip()
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip().lower().replace(' ', '_')
-                    value = value.strip()
-                    
-                    if key in ['company_name', 'company', 'organization']:
-                        params['company_name'] = value
-                    elif key in ['end_date', 'trial_end_date', 'new_end_date']:
-                        params['end_date'] = value
-                    elif key in ['features', 'beta_features', 'requested_features']:
-                        # Handle comma-separated features
-                        params['features'] = [f.strip() for f in value.split(',')]
-                    elif key in ['subscription_type', 'new_plan', 'target_plan']:
-                        params['subscription_type'] = value
-                    elif key in ['current_plan', 'current_subscription']:
-                        params['current_plan'] = value
+            # Parse common patterns from description; later lines override earlier ones
+            for match in _TASK_PARAM_RE.finditer(description):
+                key, value = match.groups()
+                param = _TASK_PARAM_ALIASES[key.lower().replace(' ', '_')]
+                if param == 'features':
+                    # Handle comma-separated features
+                    params['features'] = [f.strip() for f in value.split(',')]
+                else:
+                    params[param] = value
             
             return params
         except Exception as e:
@@ -985,7 +1036,7 @@ The ticket status has been updated to: **{status.title()}**"""
             logger.info(f"Executing beta features enablement for {email}: {features}")
             
             # Simulate beta features enablement
-            features_list = "\n".join([f"• {feature}" for feature in features]) if features else "• Features not specified"
+            features_list = "\n".join(f"• {feature}" for feature in features) or "• Features not specified"
             
             result = f"""✅ **BETA FEATURES ENABLED**
             
@@ -1040,11 +1091,23 @@ The ticket status has been updated to: **{status.title()}**"""
             logger.error(f"Error executing subscription upgrade: {e}")
             return f"❌ Error upgrading subscription: {str(e)}"
 
+# Process-wide handler, so every caller shares one Flask app, JIRA client and worker
+_handler: Optional[JiraWebhookHandler] = None
+_handler_lock = threading.Lock()
+
+def get_handler() -> JiraWebhookHandler:
+    """Return the shared webhook handler, creating it on first use"""
+    global _handler
+    if _handler is None:
+        with _handler_lock:
+            if _handler is None:
+                _handler = JiraWebhookHandler()
+    return _handler
+
 #Convenience function to start webhook server
 def start_webhook_server(port=5000):
     """Start the JIRA webhook server"""
-    handler = JiraWebhookHandler()
-    handler.run(port=port)
+    get_handler().run(port=port)
 
 if __name__ == "__main__":
     start_webhook_server()
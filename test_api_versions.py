@@ -4,26 +4,33 @@ from dotenv import load_dotenv
 
 load_dotenv('env/.env.local.user', override=True)
 
-api_versions = [
-    "2024-02-15-preview",
-    "2024-05-01-preview", 
-    "2024-10-01-preview"
-]
+# The version the bot and creator script use; the newer previews are only tried when asked
+API_VERSION = "2024-02-15-preview"
+api_versions = [API_VERSION]
+if os.getenv("PROBE_ALL_VERSIONS"):
+    api_versions += ["2024-05-01-preview", "2024-10-01-preview"]
+
+api_key = os.getenv('SECRET_AZURE_OPENAI_API_KEY')
+endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
+model = os.getenv("AZURE_OPENAI_MODEL_DEPLOYMENT_NAME")
+
+# One client for the whole probe; with_options copies it per version but keeps its HTTP connection pool
+base_client = AzureOpenAI(
+    api_key=api_key,
+    api_version=api_versions[0],
+    azure_endpoint=endpoint
+)
 
 for version in api_versions:
     print(f"\n=== Testing API Version: {version} ===")
     
-    client = AzureOpenAI(
-        api_key=os.getenv('SECRET_AZURE_OPENAI_API_KEY'),
-        api_version=version,
-        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
-    )
+    client = base_client.with_options(api_version=version)
     
     try:
         response = client.beta.assistants.create(
             name="Test Assistant",
             instructions="You are a test assistant.",
-            model=os.getenv("AZURE_OPENAI_MODEL_DEPLOYMENT_NAME")
+            model=model
         )
         
         if hasattr(response, 'id'):
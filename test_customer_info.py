@@ -6,6 +6,7 @@ Test the get_customer_info functionality
 import asyncio
 import sys
 import os
+from datetime import date
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from slm_api import SLMAPIClient
@@ -24,22 +25,23 @@ async def test_customer_info():
     ]
     
     async with SLMAPIClient() as client:
-        for email in test_customers:
+        # Look up every customer at once; each lookup fetches its plan and tenant details together
+        results = await asyncio.gather(*(
+            asyncio.gather(client.fetch_subscription_plan(email), client.fetch_tenant_details(email))
+            for email in test_customers
+        ))
+        
+        today = date.today()
+        for email, (subscription, tenant_details) in zip(test_customers, results):
             print(f"\n=== Customer Info: {email} ===")
             
-            subscription = await client.fetch_subscription_plan(email)
-            tenant_details = await client.fetch_tenant_details(email)
-            
             if subscription and tenant_details:
                 features_list = tenant_details['features']
                 features_display = ', '.join(features_list) if features_list else "None"
                 
                 # Calculate days until plan expires
-                from datetime import datetime
                 try:
-                    end_date = datetime.strptime(subscription['end_date'], '%Y-%m-%d')
-                    current_date = datetime.now()
-                    days_remaining = (end_date - current_date).days
+                    days_remaining = (date.fromisoformat(subscription['end_date']) - today).days
                     
                     if days_remaining > 0:
                         expiry_info = f"Plan expires in {days_remaining} days ({subscription['end_date']})"
@@ -47,7 +49,7 @@ async def test_customer_info():
                         expiry_info = f"Plan expires today! ({subscription['end_date']})"
                     else:
                         expiry_info = f"Plan expired {abs(days_remaining)} days ago ({subscription['end_date']})"
-                except:
+                except (TypeError, ValueError):
                     expiry_info = f"Plan end date: {subscription['end_date']}"
                 
                 print(f"Company: {tenant_details['customer']}")
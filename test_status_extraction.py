@@ -7,7 +7,7 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from webhook_handler import JiraWebhookHandler
+from webhook_handler import get_handler
 
 # Test payload with status change
 test_payload = {
@@ -31,7 +31,7 @@ test_payload = {
 }
 
 # Initialize handler
-handler = JiraWebhookHandler()
+handler = get_handler()
 
 # Test the extraction methods
 print("Testing status change extraction...")
@@ -40,3 +40,19 @@ print(f"Status change: {status_change}")
 
 issue_info = handler.extract_issue_info(test_payload)
 print(f"Issue info: {issue_info}")
+
+# Plain-string descriptions from Jira can use CRLF line endings
+print("\nTesting task parameter extraction with CRLF line endings...")
+task_params = handler.extract_task_parameters({"description": "Company: Foo Inc\r\nFeatures: A, B\r\n"})
+print(f"Task params: {task_params}")
+assert task_params == {"company_name": "Foo Inc", "features": ["A", "B"]}, task_params
+
+print("\nTesting customer email extraction with CRLF line endings...")
+customer_email = handler.extract_customer_email({"fields": {"summary": "Trial Extension", "description": "Customer Email: a@b.com\r\nNote: reach x@y.com"}})
+print(f"Customer email: {customer_email}")
+assert customer_email == "a@b.com", customer_email
+
+print("\nTesting customer email extraction skips addresses on lines with ':'...")
+customer_email = handler.extract_customer_email({"fields": {"summary": "Trial Extension", "description": "Sent by ops@x.com at 10:30\r\nCustomer Email: a@b.com"}})
+print(f"Customer email: {customer_email}")
+assert customer_email == "a@b.com", customer_email